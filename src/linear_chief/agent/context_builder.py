@@ -5,9 +5,12 @@ including recent issues, briefings, and semantic search capabilities.
 """
 
 import re
-import unicodedata
+import sys
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
+from unicodedata import category as _category, normalize as _unicode_normalize
 
 from linear_chief.storage import get_session_maker, get_db_session
 from linear_chief.storage.repositories import IssueHistoryRepository, BriefingRepository
@@ -17,11 +20,27 @@ from linear_chief.config import CACHE_TTL_HOURS
 
 logger = get_logger(__name__)
 
+# Linear issue ID: 1-4 uppercase letters, dash, 1-5 digits
+# Examples: DMD-480, CSM-93, AI-1799, PROJ-12345
+_ISSUE_ID_RE = re.compile(r"\b([A-Z]{1,4}-\d{1,5})\b")
 
+# Czech diacritics (precomposed/NFC forms) and ASCII uppercase mapped to
+# lowercase ASCII, so one translate() both strips accents and lowercases
+_CZECH_FOLD = str.maketrans(
+    "áčďéěíňóřšťúůýžÁČĎÉĚÍŇÓŘŠŤÚŮÝŽABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "acdeeinorstuuyzacdeeinorstuuyzabcdefghijklmnopqrstuvwxyz",
+)
+
+
+@lru_cache(maxsize=2048)
 def _normalize_name(name: str) -> str:
     """
     Normalize name for matching (remove diacritics, lowercase).
 
+    Results are memoized and interned: the configured user name and
+    recurring assignees are compared against every issue, and equal
+    normalized names then compare by identity.
+
     Handles Czech diacritics: á→a, č→c, ď→d, é→e, ě→e, í→i, ň→n,
     ó→o, ř→r, š→s, ť→t, ú→u, ů→u, ý→y, ž→z
 
@@ -41,17 +60,62 @@ def _normalize_name(name: str) -> str:
     Returns:
         Normalized name (lowercase, no diacritics)
     """
-    # Normalize to NFD (decomposed form): "é" → "e" + combining accent
-    normalized = unicodedata.normalize("NFD", name)
+    # ASCII names carry no diacritics, so skip the NFD pass entirely
+    if name.isascii():
+        return sys.intern(name.lower().strip())
+
+    # Czech names map to ASCII with a single table lookup per character
+    folded = name.strip().translate(_CZECH_FOLD)
+    if folded.isascii():
+        return sys.intern(folded)
+
+    # Other diacritics (or already-decomposed input): normalize to NFD
+    # (decomposed form): "é" → "e" + combining accent
+    normalized = _unicode_normalize("NFD", name)
 
     # Remove combining characters (category 'Mn' = Mark, nonspacing)
     # This strips all diacritics: "e" + combining accent → "e"
-    normalized = "".join(
-        char for char in normalized if unicodedata.category(char) != "Mn"
-    )
+    normalized = "".join(char for char in normalized if _category(char) != "Mn")
+
+    # Lowercase and strip whitespace. Lowercasing runs only after accents are
+    # gone, and uses lower() rather than casefold(), so mostly-ASCII results
+    # stay on CPython's ASCII fast path (casefold would also change "ß" → "ss")
+    return sys.intern(normalized.lower().strip())
+
+
+def _is_normalized(name: str) -> bool:
+    """Check whether name is already in _normalize_name() output form."""
+    return name.isascii() and name == name.lower() == name.strip()
 
-    # Lowercase and strip whitespace
-    return normalized.lower().strip()
+
+@dataclass(frozen=True, slots=True)
+class PreparedUser:
+    """Configured user with matching keys normalized once.
+
+    Built once per context build so the per-issue matching loop only
+    normalizes the assignee side.
+
+    Attributes:
+        name: Configured user name (from .env)
+        email: Configured user email (from .env)
+        name_norm: Normalized name ("" if no name configured)
+        email_norm: Lowercased, stripped email ("" if no email configured)
+    """
+
+    name: str
+    email: str
+    name_norm: str
+    email_norm: str
+
+    @classmethod
+    def from_config(cls, user_name: str, user_email: str) -> "PreparedUser":
+        """Create a PreparedUser from raw configured name and email."""
+        return cls(
+            name=user_name,
+            email=user_email,
+            name_norm=_normalize_name(user_name) if user_name else "",
+            email_norm=user_email.lower().strip() if user_email else "",
+        )
 
 
 def _is_user_assignee(
@@ -81,24 +145,51 @@ def _is_user_assignee(
         user_name: Configured user name (from .env)
         user_email: Configured user email (from .env)
 
+    Returns:
+        True if assignee matches the configured user
+    """
+    return _is_prepared_user_assignee(
+        assignee_name, assignee_email, PreparedUser.from_config(user_name, user_email)
+    )
+
+
+def _is_prepared_user_assignee(
+    assignee_name: Optional[str],
+    assignee_email: Optional[str],
+    user: PreparedUser,
+) -> bool:
+    """
+    Check if assignee matches a pre-normalized configured user.
+
+    Same matching rules as _is_user_assignee(), but the user side is
+    normalized once up front instead of on every call.
+
+    Args:
+        assignee_name: Name from Linear (may have diacritics)
+        assignee_email: Email from Linear
+        user: Configured user with pre-normalized name and email
+
     Returns:
         True if assignee matches the configured user
     """
     # Strategy 1: Email match (most reliable)
-    if assignee_email and user_email:
-        if assignee_email.lower().strip() == user_email.lower().strip():
-            logger.debug(f"User match via email: {assignee_email} == {user_email}")
+    if assignee_email and user.email_norm:
+        if assignee_email.lower().strip() == user.email_norm:
+            logger.debug(f"User match via email: {assignee_email} == {user.email}")
             return True
 
     # Strategy 2: Name match (normalized, diacritic-insensitive)
-    if assignee_name and user_name:
+    if assignee_name and user.name_norm:
+        # Already-normalized names compare as-is without a normalization pass
+        if _is_normalized(assignee_name):
+            return assignee_name == user.name_norm
+
         normalized_assignee = _normalize_name(assignee_name)
-        normalized_user = _normalize_name(user_name)
 
-        if normalized_assignee == normalized_user:
+        if normalized_assignee == user.name_norm:
             logger.debug(
                 f"User match via name: '{assignee_name}' (normalized: '{normalized_assignee}') "
-                f"== '{user_name}' (normalized: '{normalized_user}')"
+                f"== '{user.name}' (normalized: '{user.name_norm}')"
             )
             return True
 
@@ -169,6 +260,9 @@ async def build_conversation_context(
                 # Filter user's assigned issues
                 from linear_chief.config import LINEAR_USER_NAME, LINEAR_USER_EMAIL
 
+                user = PreparedUser.from_config(
+                    LINEAR_USER_NAME or "", LINEAR_USER_EMAIL or ""
+                )
                 user_issues = []
                 other_issues = []
 
@@ -177,11 +271,10 @@ async def build_conversation_context(
                     assignee_email = getattr(issue, "assignee_email", None)
 
                     # Check if assigned to configured user (with diacritic-aware matching)
-                    is_user_issue = _is_user_assignee(
+                    is_user_issue = _is_prepared_user_assignee(
                         assignee_name=assignee_name,
                         assignee_email=assignee_email,
-                        user_name=LINEAR_USER_NAME or "",
-                        user_email=LINEAR_USER_EMAIL or "",
+                        user=user,
                     )
 
                     if is_user_issue:
@@ -479,11 +572,7 @@ def extract_issue_ids(query: str) -> List[str]:
     Returns:
         List of issue IDs found (e.g., ['CSM-93', 'DMD-480'])
     """
-    # Pattern: 1-4 uppercase letters, dash, 1-5 digits
-    # Examples: DMD-480, CSM-93, AI-1799, PROJ-12345
-    pattern = r"\b([A-Z]{1,4}-\d{1,5})\b"
-
-    issue_ids = re.findall(pattern, query)
+    issue_ids = _ISSUE_ID_RE.findall(query)
     return list(set(issue_ids))  # Deduplicate
 
 
@@ -6,6 +6,7 @@ to learn engagement patterns and improve issue ranking for personalized briefing
 
 import math
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Tuple, Optional, Dict, Any
 
 from linear_chief.storage import get_session_maker, get_db_session
@@ -481,3 +482,17 @@ class EngagementTracker:
                 extra={"error_type": type(e).__name__},
             )
             return None
+
+
+@lru_cache(maxsize=1)
+def get_engagement_tracker() -> EngagementTracker:
+    """
+    Get the shared EngagementTracker instance.
+
+    EngagementTracker holds no per-user state and goes through the shared
+    session maker, so one instance can serve every ranker.
+
+    Returns:
+        Process-wide EngagementTracker instance
+    """
+    return EngagementTracker()
@@ -20,15 +20,26 @@ Example Usage:
     ranked_issues = await ranker.rank_issues(issues, base_priorities)
 """
 
+import heapq
 import logging
+import re
+from dataclasses import dataclass
 from typing import Any, Optional
-from collections import defaultdict
 
 from ..config import LINEAR_USER_EMAIL
+from .engagement_tracker import EngagementTracker, get_engagement_tracker
 from .preference_learner import TOPIC_KEYWORDS
 
 logger = logging.getLogger(__name__)
 
+# One precompiled alternation per topic, so each topic is a single C-level scan
+# instead of a Python loop of substring checks. Keywords keep substring
+# semantics ("auth" matches "authentication"), as in PreferenceLearner.
+_TOPIC_PATTERNS: dict[str, re.Pattern[str]] = {
+    topic: re.compile("|".join(re.escape(keyword) for keyword in keywords))
+    for topic, keywords in TOPIC_KEYWORDS.items()
+}
+
 
 def extract_topics(text: str) -> list[str]:
     """
@@ -47,13 +58,114 @@ def extract_topics(text: str) -> list[str]:
         ["backend", "performance"]
     """
     text_lower = text.lower()
-    detected = []
+    return [topic for topic, pattern in _TOPIC_PATTERNS.items() if pattern.search(text_lower)]
+
+
+# Marks score views that have not been built yet (None is a valid source)
+_UNSET: Any = object()
+
+
+def _normalize_issue(issue: dict[str, Any]) -> tuple[list[str], str, str]:
+    """
+    Extract the fields the score methods read from an issue.
+
+    Linear returns labels either as {"nodes": [...]} or as a plain list, and
+    team may be missing or None. Resolving those shapes once per issue lets
+    the topic/team/label scores read flat fields instead of re-inspecting the
+    raw payload on every call. The issue dictionary is not modified.
+
+    Args:
+        issue: Issue dictionary from Linear
+
+    Returns:
+        Tuple of (label names, team name or "", title + description text)
+    """
+    labels = issue.get("labels") or {}
+    if isinstance(labels, dict):
+        label_nodes = labels.get("nodes", [])
+    elif isinstance(labels, list):
+        label_nodes = labels
+    else:
+        label_nodes = []
+
+    team = issue.get("team") or {}
+
+    label_names = [
+        label["name"] for label in label_nodes if isinstance(label, dict) and label.get("name")
+    ]
+    team_name = (team.get("name") or "") if isinstance(team, dict) else ""
+    text = f"{issue.get('title', '')} {issue.get('description', '')}"
+
+    return label_names, team_name, text
+
+
+@dataclass(slots=True)
+class ScoringIssue:
+    """Flattened issue carrying only the fields the score methods read.
+
+    Built once per issue in rank_issues so the scoring loop uses slotted
+    attribute access instead of repeated dict lookups.
+
+    Attributes:
+        identifier: Issue identifier ("" if missing)
+        text: Combined title + description
+        team_name: Team name ("" if missing)
+        labels: List of label names
+        base_priority: Base priority used for personalization
+    """
+
+    identifier: str
+    text: str
+    team_name: str
+    labels: list[str]
+    base_priority: float = 5.0
+
+    @classmethod
+    def from_raw(
+        cls,
+        issue: dict[str, Any],
+        base_priorities: dict[str, float] | None = None,
+    ) -> "ScoringIssue":
+        """
+        Build a ScoringIssue from a Linear issue dictionary.
+
+        Args:
+            issue: Issue dictionary with title, description, team, labels, etc.
+            base_priorities: Optional pre-calculated base priorities (issue_id -> priority).
+                Falls back to issue["_analysis"]["priority"], then 5.0.
+
+        Returns:
+            ScoringIssue for the issue
+        """
+        labels, team_name, text = _normalize_issue(issue)
+        identifier = issue.get("identifier") or ""
+
+        if base_priorities and identifier:
+            base_priority = base_priorities.get(identifier, 5.0)
+        else:
+            base_priority = issue.get("_analysis", {}).get("priority", 5.0)
+
+        return cls(
+            identifier=identifier,
+            text=text,
+            team_name=team_name,
+            labels=labels,
+            base_priority=float(base_priority),
+        )
+
 
-    for topic, keywords in TOPIC_KEYWORDS.items():
-        if any(keyword in text_lower for keyword in keywords):
-            detected.append(topic)
+def _as_scoring_issue(issue: dict[str, Any] | ScoringIssue) -> ScoringIssue:
+    """Return issue as a ScoringIssue, converting raw dictionaries."""
+    if isinstance(issue, ScoringIssue):
+        return issue
+    return ScoringIssue.from_raw(issue)
 
-    return detected
+
+def _identifier(issue: dict[str, Any] | ScoringIssue) -> str | None:
+    """Return the issue identifier without normalizing a raw dictionary."""
+    if isinstance(issue, ScoringIssue):
+        return issue.identifier
+    return issue.get("identifier")
 
 
 class PreferenceBasedRanker:
@@ -73,27 +185,38 @@ class PreferenceBasedRanker:
     Attributes:
         user_id: User identifier for preference lookup
         preference_learner: Lazy-loaded PreferenceLearner instance
-        engagement_tracker: Lazy-loaded EngagementTracker instance
+        engagement_tracker: EngagementTracker instance (shared across rankers by default)
         _cached_preferences: Cached preference data
     """
 
-    def __init__(self, user_id: str | None = None) -> None:
+    def __init__(
+        self,
+        user_id: str | None = None,
+        engagement_tracker: EngagementTracker | None = None,
+    ) -> None:
         """
         Initialize PreferenceBasedRanker.
 
         Args:
             user_id: User identifier (defaults to LINEAR_USER_EMAIL from config)
+            engagement_tracker: Optional tracker (defaults to the shared instance
+                from get_engagement_tracker())
         """
         self.user_id = user_id or LINEAR_USER_EMAIL or "default_user"
         self.preference_learner = None  # Lazy load
-        self.engagement_tracker = None  # Lazy load
+        self.engagement_tracker = engagement_tracker or get_engagement_tracker()
         self._cached_preferences: dict[str, Any] | None = None
+        self._views_source: dict[str, Any] | None = _UNSET
+        self._has_any_prefs = False
+        self._topic_scores: dict[str, float] = {}
+        self._team_scores: dict[str, float] = {}
+        self._label_scores: dict[str, float] = {}
 
         logger.info(f"Initialized PreferenceBasedRanker for user {self.user_id}")
 
     async def calculate_personalized_priority(
         self,
-        issue: dict[str, Any],
+        issue: dict[str, Any] | ScoringIssue,
         base_priority: float,
         context: dict[str, Any] | None = None,
     ) -> float:
@@ -104,7 +227,8 @@ class PreferenceBasedRanker:
         a personalized score that reflects user interests.
 
         Args:
-            issue: Issue dictionary with title, description, team, labels, etc.
+            issue: Issue dictionary (title, description, team, labels, etc.)
+                or a prebuilt ScoringIssue
             base_priority: Base priority from IssueAnalyzer (0.0 to 10.0)
             context: Optional context (preferences, engagement scores)
 
@@ -125,6 +249,9 @@ class PreferenceBasedRanker:
             base=5.0, prefs=0.3, engagement=0.1 → 5.0 * (1 - 0.2 + 0.03) = 4.15
             base=7.0, prefs=0.5, engagement=0.0 → 7.0 * (1 + 0.0 + 0.0) = 7.0
 
+        If no topic/team/label preferences have been learned yet, the base
+        priority is returned (capped at 10.0) without an engagement lookup.
+
         Raises:
             Exception: If preference/engagement loading fails (logged and continued)
         """
@@ -133,28 +260,32 @@ class PreferenceBasedRanker:
             if not self._cached_preferences:
                 await self._load_preferences()
 
-            # Calculate preference component scores
-            topic_score = await self.get_topic_score(issue)
-            team_score = await self.get_team_score(issue)
-            label_score = await self.get_label_score(issue)
+            # Nothing learned yet: no preference can move the score, so skip
+            # topic extraction and the engagement lookup entirely
+            self._score_views()
+            if not self._has_any_prefs:
+                return min(base_priority, 10.0)
 
-            # Calculate preference boost (-0.5 to +0.5)
-            # Average preference of 0.5 = neutral (no boost)
-            avg_preference = (topic_score + team_score + label_score) / 3
-            preference_boost = avg_preference - 0.5
+            scoring = _as_scoring_issue(issue)
 
-            # Calculate engagement boost (0.0 to +0.3)
-            engagement_score = await self.get_engagement_score(issue)
-            engagement_boost = engagement_score * 0.3
+            # Calculate preference component scores
+            topic_score = await self.get_topic_score(scoring)
+            team_score = await self.get_team_score(scoring)
+            label_score = await self.get_label_score(scoring)
 
-            # Apply formula
-            personalized = base_priority * (1 + preference_boost + engagement_boost)
+            engagement_score = await self.get_engagement_score(scoring)
 
-            # Cap at 10.0
-            personalized = min(personalized, 10.0)
+            # Preference boost (avg preference - 0.5, neutral at 0.5) plus
+            # engagement boost (engagement * 0.3), fused into one weighted sum
+            boost = (topic_score + team_score + label_score) * (1.0 / 3.0) + (
+                engagement_score * 0.3 - 0.5
+            )
+
+            # Apply formula, capped at 10.0
+            personalized = min(base_priority * (1.0 + boost), 10.0)
 
             logger.debug(
-                f"Personalized priority for {issue.get('identifier', 'unknown')}: "
+                f"Personalized priority for {scoring.identifier or 'unknown'}: "
                 f"base={base_priority:.2f}, topic={topic_score:.2f}, "
                 f"team={team_score:.2f}, label={label_score:.2f}, "
                 f"engagement={engagement_score:.2f}, "
@@ -166,13 +297,13 @@ class PreferenceBasedRanker:
         except Exception as e:
             logger.error(
                 f"Error calculating personalized priority for issue "
-                f"{issue.get('identifier', 'unknown')}: {e}",
+                f"{_identifier(issue) or 'unknown'}: {e}",
                 exc_info=True,
             )
             # Fallback to base priority on error
             return base_priority
 
-    async def get_topic_score(self, issue: dict[str, Any]) -> float:
+    async def get_topic_score(self, issue: dict[str, Any] | ScoringIssue) -> float:
         """
         Get preference score for issue topics.
 
@@ -180,18 +311,14 @@ class PreferenceBasedRanker:
         Returns average preference score for detected topics.
 
         Args:
-            issue: Issue dictionary with title and description
+            issue: Issue dictionary with title and description, or a ScoringIssue
 
         Returns:
             Average topic preference score (0.0 to 1.0), 0.5 if no topics detected
         """
         try:
-            # Extract topics from title + description
-            title = issue.get("title", "")
-            description = issue.get("description", "")
-            combined_text = f"{title} {description}"
-
-            detected_topics = extract_topics(combined_text)
+            scoring = _as_scoring_issue(issue)
+            detected_topics = extract_topics(scoring.text)
 
             if not detected_topics:
                 return 0.5  # Neutral score
@@ -200,14 +327,14 @@ class PreferenceBasedRanker:
             if not self._cached_preferences:
                 await self._load_preferences()
 
-            topic_scores = self._cached_preferences.get("topic_scores", {})
+            topic_scores = self._score_views()[0]
 
             # Calculate average score for detected topics
             scores = [topic_scores.get(topic, 0.5) for topic in detected_topics]
             avg_score = sum(scores) / len(scores) if scores else 0.5
 
             logger.debug(
-                f"Topic score for {issue.get('identifier', 'unknown')}: "
+                f"Topic score for {scoring.identifier or 'unknown'}: "
                 f"topics={detected_topics}, score={avg_score:.2f}"
             )
 
@@ -217,20 +344,19 @@ class PreferenceBasedRanker:
             logger.error(f"Error calculating topic score: {e}", exc_info=True)
             return 0.5  # Neutral score on error
 
-    async def get_team_score(self, issue: dict[str, Any]) -> float:
+    async def get_team_score(self, issue: dict[str, Any] | ScoringIssue) -> float:
         """
         Get preference score for issue team.
 
         Args:
-            issue: Issue dictionary with team information
+            issue: Issue dictionary with team information, or a ScoringIssue
 
         Returns:
             Team preference score (0.0 to 1.0), 0.5 if no preference
         """
         try:
-            # Extract team name
-            team = issue.get("team", {})
-            team_name = team.get("name") if isinstance(team, dict) else None
+            scoring = _as_scoring_issue(issue)
+            team_name = scoring.team_name
 
             if not team_name:
                 return 0.5  # Neutral score
@@ -239,11 +365,10 @@ class PreferenceBasedRanker:
             if not self._cached_preferences:
                 await self._load_preferences()
 
-            team_scores = self._cached_preferences.get("team_scores", {})
-            score = team_scores.get(team_name, 0.5)
+            score = self._score_views()[1].get(team_name, 0.5)
 
             logger.debug(
-                f"Team score for {issue.get('identifier', 'unknown')}: "
+                f"Team score for {scoring.identifier or 'unknown'}: "
                 f"team={team_name}, score={score:.2f}"
             )
 
@@ -253,33 +378,19 @@ class PreferenceBasedRanker:
             logger.error(f"Error calculating team score: {e}", exc_info=True)
             return 0.5  # Neutral score on error
 
-    async def get_label_score(self, issue: dict[str, Any]) -> float:
+    async def get_label_score(self, issue: dict[str, Any] | ScoringIssue) -> float:
         """
         Get preference score for issue labels.
 
         Args:
-            issue: Issue dictionary with labels
+            issue: Issue dictionary with labels, or a ScoringIssue
 
         Returns:
             Average label preference score (0.0 to 1.0), 0.5 if no labels/preferences
         """
         try:
-            # Extract label names
-            labels = issue.get("labels", {})
-
-            # Handle both list and dict formats
-            if isinstance(labels, dict):
-                label_nodes = labels.get("nodes", [])
-            elif isinstance(labels, list):
-                label_nodes = labels
-            else:
-                return 0.5  # Neutral score
-
-            label_names = [
-                label.get("name")
-                for label in label_nodes
-                if isinstance(label, dict) and label.get("name")
-            ]
+            scoring = _as_scoring_issue(issue)
+            label_names = scoring.labels
 
             if not label_names:
                 return 0.5  # Neutral score
@@ -288,14 +399,14 @@ class PreferenceBasedRanker:
             if not self._cached_preferences:
                 await self._load_preferences()
 
-            label_scores = self._cached_preferences.get("label_scores", {})
+            label_scores = self._score_views()[2]
 
             # Calculate average score for labels
             scores = [label_scores.get(label, 0.5) for label in label_names]
             avg_score = sum(scores) / len(scores) if scores else 0.5
 
             logger.debug(
-                f"Label score for {issue.get('identifier', 'unknown')}: "
+                f"Label score for {scoring.identifier or 'unknown'}: "
                 f"labels={label_names}, score={avg_score:.2f}"
             )
 
@@ -305,7 +416,7 @@ class PreferenceBasedRanker:
             logger.error(f"Error calculating label score: {e}", exc_info=True)
             return 0.5  # Neutral score on error
 
-    async def get_engagement_score(self, issue: dict[str, Any]) -> float:
+    async def get_engagement_score(self, issue: dict[str, Any] | ScoringIssue) -> float:
         """
         Get engagement score for this issue.
 
@@ -313,22 +424,16 @@ class PreferenceBasedRanker:
         the user has interacted with this specific issue.
 
         Args:
-            issue: Issue dictionary with identifier
+            issue: Issue dictionary with identifier, or a ScoringIssue
 
         Returns:
             Engagement score (0.0 to 1.0), 0.0 if no engagement
         """
         try:
-            issue_id = issue.get("identifier")
+            issue_id = _identifier(issue)
             if not issue_id:
                 return 0.0
 
-            # Lazy load engagement tracker
-            if not self.engagement_tracker:
-                from .engagement_tracker import EngagementTracker
-
-                self.engagement_tracker = EngagementTracker()
-
             # Get engagement score
             score = await self.engagement_tracker.calculate_engagement_score(
                 user_id=self.user_id, issue_id=issue_id
@@ -346,6 +451,7 @@ class PreferenceBasedRanker:
         self,
         issues: list[dict[str, Any]],
         base_priorities: dict[str, float] | None = None,
+        top_k: int | None = None,
     ) -> list[tuple[dict[str, Any], float]]:
         """
         Rank list of issues with personalized priorities.
@@ -353,9 +459,12 @@ class PreferenceBasedRanker:
         Args:
             issues: List of issue dictionaries
             base_priorities: Optional pre-calculated base priorities (issue_id -> priority)
+            top_k: Optional number of top issues to return. Uses a partial sort
+                (heapq.nlargest) instead of sorting all issues.
 
         Returns:
             List of (issue, personalized_priority) tuples sorted by priority desc
+            (at most top_k entries if top_k is set)
 
         Example:
             ranked = await ranker.rank_issues(issues, {"PROJ-1": 8.0, "PROJ-2": 5.0})
@@ -365,41 +474,42 @@ class PreferenceBasedRanker:
         try:
             logger.info(f"Ranking {len(issues)} issues with personalized priorities")
 
-            ranked = []
-
-            for issue in issues:
-                issue_id = issue.get("identifier")
+            # Flatten each issue once (base priority falls back to _analysis)
+            scoring_issues = [ScoringIssue.from_raw(issue, base_priorities) for issue in issues]
 
-                # Get base priority
-                if base_priorities and issue_id:
-                    base_priority = base_priorities.get(issue_id, 5.0)
-                else:
-                    # Extract from _analysis if available
-                    base_priority = issue.get("_analysis", {}).get("priority", 5.0)
+            ranked = []
 
+            for issue, scoring in zip(issues, scoring_issues):
                 # Calculate personalized priority
                 personalized_priority = await self.calculate_personalized_priority(
-                    issue=issue,
-                    base_priority=float(base_priority),
+                    issue=scoring,
+                    base_priority=scoring.base_priority,
                 )
 
                 ranked.append((issue, personalized_priority))
 
             # Sort by priority (highest first)
-            ranked.sort(key=lambda x: x[1], reverse=True)
+            if top_k is not None:
+                ranked = heapq.nlargest(top_k, ranked, key=lambda x: x[1])
+            else:
+                ranked.sort(key=lambda x: x[1], reverse=True)
 
-            logger.info(
-                f"Ranked {len(ranked)} issues. Top issue: "
-                f"{ranked[0][0].get('identifier', 'unknown')} "
-                f"(priority: {ranked[0][1]:.2f})"
-            )
+            if ranked:
+                logger.info(
+                    f"Ranked {len(ranked)} issues. Top issue: "
+                    f"{ranked[0][0].get('identifier', 'unknown')} "
+                    f"(priority: {ranked[0][1]:.2f})"
+                )
 
             return ranked
 
         except Exception as e:
             logger.error(f"Error ranking issues: {e}", exc_info=True)
             # Return issues with base priorities on error
-            return [(issue, issue.get("_analysis", {}).get("priority", 5.0)) for issue in issues]
+            fallback = [
+                (issue, issue.get("_analysis", {}).get("priority", 5.0)) for issue in issues
+            ]
+            return fallback[:top_k] if top_k is not None else fallback
 
     async def get_preference_context(self) -> dict[str, Any]:
         """
@@ -453,6 +563,7 @@ class PreferenceBasedRanker:
 
             # Load preferences
             self._cached_preferences = await self.preference_learner.get_preferences()
+            self._score_views()
 
             logger.info(
                 f"Loaded preferences for user {self.user_id}: "
@@ -469,3 +580,30 @@ class PreferenceBasedRanker:
                 "team_scores": {},
                 "label_scores": {},
             }
+
+    def _score_views(
+        self,
+    ) -> tuple[dict[str, float], dict[str, float], dict[str, float]]:
+        """
+        Get topic/team/label score lookups from the cached preferences.
+
+        The lookups are resolved once per _cached_preferences object (rebuilt
+        only when it is replaced), and _has_any_prefs is refreshed alongside.
+        Callers use .get(key, 0.5) so unknown keys score neutral without
+        being inserted.
+
+        Returns:
+            Tuple of (topic_scores, team_scores, label_scores) dicts
+        """
+        prefs = self._cached_preferences
+        if self._views_source is not prefs:
+            source = prefs or {}
+            self._topic_scores = source.get("topic_scores") or {}
+            self._team_scores = source.get("team_scores") or {}
+            self._label_scores = source.get("label_scores") or {}
+            self._has_any_prefs = bool(
+                self._topic_scores or self._team_scores or self._label_scores
+            )
+            self._views_source = prefs
+
+        return self._topic_scores, self._team_scores, self._label_scores
@@ -11,13 +11,70 @@ Includes:
 - Briefing integration
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
 from linear_chief.intelligence.semantic_search import SemanticSearchService
 
 logger = logging.getLogger(__name__)
 
+# Search result cache bounds (shared by all suggester instances)
+SEARCH_CACHE_MAXSIZE = 256
+SEARCH_CACHE_TTL_SECONDS = 60.0
+
+# Callers create a new suggester per request, so the cache lives at module
+# level: LRU of search key -> (inserted_at, results), bounded and TTL-limited
+_search_cache: OrderedDict[Tuple[Any, ...], Tuple[float, List[Dict[str, Any]]]] = (
+    OrderedDict()
+)
+# One lock per key with a fetch in flight
+_search_locks: Dict[Tuple[Any, ...], asyncio.Lock] = {}
+
+# Similarity above which a result is classified as a potential duplicate
+DUPLICATE_THRESHOLD = 0.85
+
+# Keywords that trigger related suggestions (matched as substrings)
+TRIGGER_KEYWORDS = (
+    "related",
+    "similar",
+    "connected",
+    "associated",
+    "linked",
+    "dependency",
+    "depends",
+    "connection",
+)
+_TRIGGER_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in TRIGGER_KEYWORDS), re.IGNORECASE
+)
+
+
+def clear_search_cache() -> None:
+    """Drop all cached search results (e.g. after re-indexing issues)."""
+    _search_cache.clear()
+
+
+def _cache_get(key: Tuple[Any, ...]) -> Optional[List[Dict[str, Any]]]:
+    """Return fresh cached results for key (marking it recently used), or None."""
+    entry = _search_cache.get(key)
+    if entry is None or time.monotonic() - entry[0] >= SEARCH_CACHE_TTL_SECONDS:
+        return None
+    _search_cache.move_to_end(key)
+    logger.debug("Search cache hit", extra={"cache_key": key})
+    return entry[1]
+
+
+def _cache_put(key: Tuple[Any, ...], results: List[Dict[str, Any]]) -> None:
+    """Store results for key, evicting the least recently used entries."""
+    _search_cache[key] = (time.monotonic(), results)
+    _search_cache.move_to_end(key)
+    while len(_search_cache) > SEARCH_CACHE_MAXSIZE:
+        _search_cache.popitem(last=False)
+
 
 class RelatedIssuesSuggester:
     """Suggests related issues using semantic similarity.
@@ -40,6 +97,41 @@ class RelatedIssuesSuggester:
         self.search_service = SemanticSearchService()
         logger.info("RelatedIssuesSuggester initialized")
 
+    async def _cached_search(
+        self,
+        key: Tuple[Any, ...],
+        fetch: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Return search results for key, calling fetch only on a cache miss.
+
+        Repeated identical searches skip the embedding + vector search, also
+        across suggester instances. A lock per key makes concurrent callers
+        wait for the first fetch instead of all searching at once; the lock
+        is dropped once that fetch finishes. Errors are not cached.
+
+        Args:
+            key: Cache key identifying the search and its parameters
+            fetch: Coroutine factory performing the actual search
+
+        Returns:
+            Copy of the search results (callers may annotate the dicts)
+        """
+        lock = _search_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                results = _cache_get(key)
+                if results is None:
+                    results = await fetch()
+                    _cache_put(key, results)
+        finally:
+            # Waiters already hold this lock; later callers hit the cache
+            # (or, after a failure, start a fresh fetch under a new lock)
+            if _search_locks.get(key) is lock:
+                del _search_locks[key]
+
+        return [dict(result) for result in results]
+
     async def get_related_issues(
         self,
         issue_id: str,
@@ -90,39 +182,18 @@ class RelatedIssuesSuggester:
             # Use semantic search to find similar issues
             # Request more results than needed to account for filtering
             search_limit = limit * 3 if exclude_duplicates else limit
-            similar_issues = await self.search_service.find_similar_issues(
-                issue_id=issue_id,
-                limit=search_limit,
-                min_similarity=min_similarity,
+            similar_issues = await self._cached_search(
+                ("similar", issue_id, search_limit, min_similarity),
+                lambda: self.search_service.find_similar_issues(
+                    issue_id=issue_id,
+                    limit=search_limit,
+                    min_similarity=min_similarity,
+                ),
             )
 
-            # Process and classify results
-            related_issues = []
-            duplicate_threshold = 0.85
-
-            for issue in similar_issues:
-                similarity = issue.get("similarity", 0.0)
-
-                # Classify as similar or duplicate
-                if similarity > duplicate_threshold:
-                    relation_type = "duplicate"
-                    # Skip if excluding duplicates
-                    if exclude_duplicates:
-                        logger.debug(
-                            f"Excluding potential duplicate {issue['issue_id']} "
-                            f"(similarity: {similarity:.2%})"
-                        )
-                        continue
-                else:
-                    relation_type = "similar"
-
-                # Add relation type to issue metadata
-                issue["relation_type"] = relation_type
-                related_issues.append(issue)
-
-                # Stop if we have enough results
-                if len(related_issues) >= limit:
-                    break
+            related_issues = self._classify_related(
+                similar_issues, limit, exclude_duplicates
+            )
 
             logger.info(
                 f"Found {len(related_issues)} related issues for {issue_id}",
@@ -152,22 +223,192 @@ class RelatedIssuesSuggester:
             # Return empty list instead of failing
             return []
 
+    @staticmethod
+    def _classify_related(
+        similar_issues: List[Dict[str, Any]],
+        limit: int,
+        exclude_duplicates: bool,
+    ) -> List[Dict[str, Any]]:
+        """
+        Tag search results as similar/duplicate and keep the top limit.
+
+        Args:
+            similar_issues: Search results, most similar first
+            limit: Maximum number of related issues
+            exclude_duplicates: Drop results above DUPLICATE_THRESHOLD
+
+        Returns:
+            Related issues with relation_type set
+        """
+        # Process and classify results (search results are already sorted
+        # by similarity, so a single pass with early exit is enough)
+        related_issues = []
+
+        for issue in similar_issues:
+            similarity = issue.get("similarity", 0.0)
+
+            # Classify as similar or duplicate
+            if similarity > DUPLICATE_THRESHOLD:
+                relation_type = "duplicate"
+                # Skip if excluding duplicates
+                if exclude_duplicates:
+                    logger.debug(
+                        "Excluding potential duplicate %s (similarity: %.2f%%)",
+                        issue["issue_id"],
+                        similarity * 100,
+                    )
+                    continue
+            else:
+                relation_type = "similar"
+
+            # Add relation type to issue metadata
+            issue["relation_type"] = relation_type
+            related_issues.append(issue)
+
+            # Stop if we have enough results
+            if len(related_issues) >= limit:
+                break
+
+        return related_issues
+
+    async def get_related_for_issues_batch(
+        self,
+        issue_ids: List[str],
+        limit: int = 3,
+        min_similarity: float = 0.6,
+        exclude_duplicates: bool = True,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get related issues for several issues with one batched search.
+
+        Same filtering as get_related_issues, but all source issues are
+        embedded and searched together. Issues that cannot be found are
+        omitted from the result.
+
+        Args:
+            issue_ids: Source issue identifiers
+            limit: Maximum number of related issues per issue (default: 3)
+            min_similarity: Minimum similarity threshold 0.0-1.0 (default: 0.6)
+            exclude_duplicates: Exclude very high similarity (>85%) duplicates
+
+        Returns:
+            Mapping of issue_id -> related issues (may be empty lists)
+        """
+        if not issue_ids:
+            return {}
+
+        search_limit = limit * 3 if exclude_duplicates else limit
+
+        # Serve issues searched recently from the shared cache
+        similar_by_issue: Dict[str, List[Dict[str, Any]]] = {}
+        misses = []
+        for issue_id in dict.fromkeys(issue_ids):
+            cached = _cache_get(("similar", issue_id, search_limit, min_similarity))
+            if cached is not None:
+                similar_by_issue[issue_id] = cached
+            else:
+                misses.append(issue_id)
+
+        if misses:
+            try:
+                batch_results = await self.search_service.find_similar_issues_batch(
+                    issue_ids=misses,
+                    limit=search_limit,
+                    min_similarity=min_similarity,
+                )
+
+            except Exception as e:
+                logger.error(
+                    "Failed to get related issues in batch, searching per issue",
+                    extra={
+                        "issue_count": len(misses),
+                        "error_type": type(e).__name__,
+                    },
+                    exc_info=True,
+                )
+                batch_results = await self._find_similar_per_issue(
+                    misses, search_limit, min_similarity
+                )
+
+            for issue_id, similar in batch_results.items():
+                _cache_put(("similar", issue_id, search_limit, min_similarity), similar)
+                similar_by_issue[issue_id] = similar
+
+        # Copy before classifying: the cached dicts must not be annotated
+        return {
+            issue_id: self._classify_related(
+                [dict(result) for result in similar], limit, exclude_duplicates
+            )
+            for issue_id, similar in similar_by_issue.items()
+        }
+
+    async def _find_similar_per_issue(
+        self,
+        issue_ids: List[str],
+        limit: int,
+        min_similarity: float,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search similar issues one issue at a time, isolating failures.
+
+        Fallback for when the batched search fails as a whole: searches run
+        concurrently and an issue whose search raises is logged and omitted.
+
+        Args:
+            issue_ids: Source issue identifiers
+            limit: Maximum number of results per issue
+            min_similarity: Minimum similarity threshold 0.0-1.0
+
+        Returns:
+            Mapping of issue_id -> similar issues for every successful search
+        """
+        results = await asyncio.gather(
+            *(
+                self.search_service.find_similar_issues(
+                    issue_id=issue_id,
+                    limit=limit,
+                    min_similarity=min_similarity,
+                )
+                for issue_id in issue_ids
+            ),
+            return_exceptions=True,
+        )
+
+        similar_by_issue = {}
+        for issue_id, similar in zip(issue_ids, results):
+            if isinstance(similar, BaseException):
+                # Non-fatal: Log warning and continue with other issues
+                logger.warning(
+                    f"Failed to get related issues for {issue_id}: {similar}",
+                    extra={
+                        "issue_id": issue_id,
+                        "error_type": type(similar).__name__,
+                    },
+                )
+                continue
+            similar_by_issue[issue_id] = similar
+
+        return similar_by_issue
+
     async def get_related_for_conversation(
         self,
         query: str,
         current_issue_id: Optional[str] = None,
         limit: int = 3,
+        exclude_ids: Iterable[str] = (),
     ) -> List[Dict[str, Any]]:
         """
         Get related issues for a conversation query.
 
         Searches for issues semantically similar to the user's query text,
-        optionally excluding the issue currently being discussed.
+        optionally excluding the issue currently being discussed and any
+        other issues the caller already knows about.
 
         Args:
             query: User's question/query text
             current_issue_id: Optional issue being discussed (to exclude)
             limit: Maximum number of suggestions
+            exclude_ids: Additional issue IDs to exclude from suggestions
 
         Returns:
             Related issues based on semantic similarity to query
@@ -180,31 +421,40 @@ class RelatedIssuesSuggester:
             ...     limit=3
             ... )
         """
+        exclude = frozenset(exclude_ids)
+        if current_issue_id:
+            exclude |= {current_issue_id}
+
         logger.info(
             "Getting related issues for conversation",
             extra={
                 "query_preview": query[:100],
                 "current_issue": current_issue_id,
+                "excluded_count": len(exclude),
                 "limit": limit,
             },
         )
 
         try:
-            # Search by text
-            results = await self.search_service.search_by_text(
-                query=query,
-                limit=limit + 1,  # +1 to account for potential exclusion
-                min_similarity=0.5,  # Lower threshold for conversations
+            # Search by text, requesting extra results to cover exclusions
+            search_limit = limit + max(len(exclude), 1)
+            results = await self._cached_search(
+                ("text", query, search_limit),
+                lambda: self.search_service.search_by_text(
+                    query=query,
+                    limit=search_limit,
+                    min_similarity=0.5,  # Lower threshold for conversations
+                ),
             )
 
-            # Filter out current issue if provided
+            # Filter out excluded issues
             related_issues = []
             for result in results:
                 issue_id = result.get("issue_id")
 
-                # Skip current issue
-                if current_issue_id and issue_id == current_issue_id:
-                    logger.debug(f"Excluding current issue {current_issue_id}")
+                # Skip current/excluded issues
+                if issue_id in exclude:
+                    logger.debug("Excluding issue %s", issue_id)
                     continue
 
                 # Add relation type
@@ -264,35 +514,31 @@ class RelatedIssuesSuggester:
         if not related:
             return ""
 
-        lines = ["**Related Issues:**"]
-
-        for idx, issue in enumerate(related, 1):
+        def format_line(idx: int, issue: Dict[str, Any]) -> str:
             issue_id = issue.get("issue_id", "Unknown")
             title = issue.get("title", "Unknown")
             url = issue.get("url", "")
             state = issue.get("state", "Unknown")
 
             # Truncate long titles (keep it concise)
-            if len(title) > 50:
-                title = title[:47] + "..."
+            title = title[:47] + "..." if len(title) > 50 else title
 
             # Format issue link
-            if url:
-                issue_link = f"[**{issue_id}**]({url})"
-            else:
-                issue_link = f"**{issue_id}**"
-
-            # Build line
-            line = f"{idx}. {issue_link} - {title} ({state})"
+            issue_link = f"[**{issue_id}**]({url})" if url else f"**{issue_id}**"
 
             # Add similarity percentage if requested
-            if show_similarity and "similarity" in issue:
-                similarity_pct = issue["similarity"] * 100
-                line += f" - {similarity_pct:.0f}% similar"
+            suffix = (
+                f" - {issue['similarity'] * 100:.0f}% similar"
+                if show_similarity and "similarity" in issue
+                else ""
+            )
 
-            lines.append(line)
+            return f"{idx}. {issue_link} - {title} ({state}){suffix}"
 
-        return "\n".join(lines)
+        body = "\n".join(
+            format_line(idx, issue) for idx, issue in enumerate(related, 1)
+        )
+        return f"**Related Issues:**\n{body}"
 
     async def add_to_briefing_context(
         self,
@@ -335,39 +581,26 @@ class RelatedIssuesSuggester:
 
         related_map: Dict[str, List[Dict[str, Any]]] = {}
 
-        for issue in issues:
-            issue_id = issue.get("identifier")
-            if not issue_id:
-                continue
-
-            try:
-                related = await self.get_related_issues(
-                    issue_id=issue_id,
-                    limit=max_related_per_issue,
-                    min_similarity=0.6,
-                    exclude_duplicates=True,
-                )
+        issue_ids = [issue["identifier"] for issue in issues if issue.get("identifier")]
 
-                if related:
-                    related_map[issue_id] = related
-                    logger.debug(
-                        f"Found {len(related)} related issues for {issue_id}",
-                        extra={
-                            "issue_id": issue_id,
-                            "related_count": len(related),
-                        },
-                    )
+        # One batched search for all issues instead of one search per issue
+        results = await self.get_related_for_issues_batch(
+            issue_ids,
+            limit=max_related_per_issue,
+            min_similarity=0.6,
+            exclude_duplicates=True,
+        )
 
-            except Exception as e:
-                # Non-fatal: Log warning and continue with other issues
-                logger.warning(
-                    f"Failed to get related issues for {issue_id}: {e}",
+        for issue_id, related in results.items():
+            if related:
+                related_map[issue_id] = related
+                logger.debug(
+                    f"Found {len(related)} related issues for {issue_id}",
                     extra={
                         "issue_id": issue_id,
-                        "error_type": type(e).__name__,
+                        "related_count": len(related),
                     },
                 )
-                continue
 
         logger.info(
             f"Found related issues for {len(related_map)}/{len(issues)} briefing issues",
@@ -405,24 +638,8 @@ def should_suggest_related(
         >>> should_suggest_related("status of AI-1799 and DMD-480", ["AI-1799", "DMD-480"])
         False  # Multiple issues - don't overwhelm
     """
-    message_lower = user_message.lower()
-
-    # Keywords that trigger related suggestions
-    trigger_keywords = [
-        "related",
-        "similar",
-        "connected",
-        "associated",
-        "linked",
-        "dependency",
-        "depends",
-        "connection",
-    ]
-
     # Single issue query with trigger keyword
-    if len(issue_ids) == 1 and any(
-        keyword in message_lower for keyword in trigger_keywords
-    ):
+    if len(issue_ids) == 1 and _TRIGGER_RE.search(user_message):
         logger.debug(
             "Auto-suggest triggered: single issue + trigger keyword",
             extra={"issue_id": issue_ids[0]},
@@ -7,6 +7,7 @@ to find similar issues based on content similarity, enabling:
 - Metadata filtering (team, state, labels)
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -98,7 +99,7 @@ class SemanticSearchService:
             min_similarity: Minimum similarity score 0.0-1.0 (default: 0.5)
 
         Returns:
-            List of similar issues with similarity scores:
+            List of similar issues with similarity scores, most similar first:
             [
                 {
                     "issue_id": "AI-1820",
@@ -129,16 +130,132 @@ class SemanticSearchService:
             logger.warning(f"Source issue {issue_id} not found")
             raise ValueError(f"Issue {issue_id} not found")
 
-        # Build query text from title and description
-        query_text = f"{source_issue['title']}\n\n{source_issue.get('description', '')}"
-
         # Search vector store (get more results than needed to account for filtering)
         search_results = await self.vector_store.search_similar(
-            query=query_text,
+            query=self._build_query_text(source_issue),
             limit=limit + 1,  # +1 to account for self-match
             filter_metadata=None,
         )
 
+        similar_issues = self._filter_similar_results(
+            issue_id, search_results, limit, min_similarity
+        )
+
+        logger.info(
+            f"Found {len(similar_issues)} similar issues for {issue_id}",
+            extra={
+                "source_issue": issue_id,
+                "results_count": len(similar_issues),
+            },
+        )
+
+        return similar_issues
+
+    async def find_similar_issues_batch(
+        self,
+        issue_ids: List[str],
+        limit: int = 5,
+        min_similarity: float = 0.5,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find issues similar to each of several issues in one vector search.
+
+        Same as find_similar_issues, but all query texts are embedded in a
+        single model call and searched with one vector store query. Issues that
+        cannot be found are skipped instead of raising.
+
+        Args:
+            issue_ids: Issue identifiers (e.g., ["AI-1799", "DMD-480"])
+            limit: Maximum number of results per issue (default: 5)
+            min_similarity: Minimum similarity score 0.0-1.0 (default: 0.5)
+
+        Returns:
+            Mapping of issue_id -> similar issues (same format as
+            find_similar_issues), for every issue that was found
+        """
+        unique_ids = list(dict.fromkeys(issue_ids))
+
+        logger.info(
+            "Finding similar issues in batch",
+            extra={
+                "issue_count": len(unique_ids),
+                "limit": limit,
+                "min_similarity": min_similarity,
+            },
+        )
+
+        # Source issue contexts are independent lookups (DB or Linear API);
+        # one failing lookup must not drop the other issues
+        contexts = await asyncio.gather(
+            *(self.get_issue_context(issue_id) for issue_id in unique_ids),
+            return_exceptions=True,
+        )
+
+        found = []
+        for issue_id, context in zip(unique_ids, contexts):
+            if isinstance(context, BaseException):
+                logger.warning(
+                    f"Failed to load source issue {issue_id}, skipping: {context}",
+                    extra={
+                        "issue_id": issue_id,
+                        "error_type": type(context).__name__,
+                    },
+                )
+            elif context:
+                found.append((issue_id, context))
+            else:
+                logger.warning(f"Source issue {issue_id} not found, skipping")
+
+        if not found:
+            return {}
+
+        batch_results = await self.vector_store.search_similar_batch(
+            queries=[self._build_query_text(context) for _, context in found],
+            limit=limit + 1,  # +1 to account for self-match
+            filter_metadata=None,
+        )
+
+        return {
+            issue_id: self._filter_similar_results(
+                issue_id, search_results, limit, min_similarity
+            )
+            for (issue_id, _), search_results in zip(found, batch_results)
+        }
+
+    @staticmethod
+    def _build_query_text(source_issue: Dict[str, Any]) -> str:
+        """
+        Build similarity query text from issue title and description.
+
+        Args:
+            source_issue: Issue context from get_issue_context
+
+        Returns:
+            Query text for vector search
+        """
+        return f"{source_issue['title']}\n\n{source_issue.get('description', '')}"
+
+    @staticmethod
+    def _filter_similar_results(
+        issue_id: str,
+        search_results: List[Dict[str, Any]],
+        limit: int,
+        min_similarity: float,
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert raw vector store results for an issue into similar issues.
+
+        Excludes the source issue itself and results below min_similarity.
+
+        Args:
+            issue_id: Source issue identifier
+            search_results: Raw results from the vector store
+            limit: Maximum number of results
+            min_similarity: Minimum similarity score 0.0-1.0
+
+        Returns:
+            Similar issues with similarity scores, most similar first
+        """
         # Process and filter results
         similar_issues = []
         for result in search_results:
@@ -180,14 +297,6 @@ class SemanticSearchService:
             if len(similar_issues) >= limit:
                 break
 
-        logger.info(
-            f"Found {len(similar_issues)} similar issues for {issue_id}",
-            extra={
-                "source_issue": issue_id,
-                "results_count": len(similar_issues),
-            },
-        )
-
         return similar_issues
 
     async def search_by_text(
@@ -210,7 +319,7 @@ class SemanticSearchService:
             filters: Optional metadata filters (team, state, labels)
 
         Returns:
-            List of matching issues with scores:
+            List of matching issues with scores, most similar first:
             [
                 {
                     "issue_id": "AI-1820",
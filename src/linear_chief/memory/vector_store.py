@@ -90,6 +90,24 @@ class IssueVectorStore:
             logger.error(f"Failed to generate embedding: {e}", exc_info=True)
             raise
 
+    def _generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts in one model call.
+
+        Args:
+            texts: Input texts to embed.
+
+        Returns:
+            Embedding vectors, one per input text, in input order.
+        """
+        try:
+            embeddings = self._model.encode(texts, normalize_embeddings=True)
+            if hasattr(embeddings, "tolist"):
+                return embeddings.tolist()  # type: ignore[no-any-return]
+            return [list(embedding) for embedding in embeddings]
+        except Exception as e:
+            logger.error(f"Failed to generate embeddings: {e}", exc_info=True)
+            raise
+
     async def add_issue(
         self,
         issue_id: str,
@@ -165,32 +183,7 @@ class IssueVectorStore:
                 where=filter_metadata,
             )
 
-            # Format results
-            similar_issues = []
-            ids = results["ids"][0] if results["ids"] is not None else []
-            documents = (
-                results["documents"][0] if results["documents"] is not None else []
-            )
-            metadatas = (
-                results["metadatas"][0] if results["metadatas"] is not None else []
-            )
-            distances = (
-                results["distances"][0]
-                if "distances" in results and results["distances"] is not None
-                else None
-            )
-
-            for i in range(len(ids)):
-                similar_issues.append(
-                    {
-                        "issue_id": ids[i],
-                        "document": documents[i] if i < len(documents) else "",
-                        "metadata": metadatas[i] if i < len(metadatas) else {},
-                        "distance": (
-                            distances[i] if distances and i < len(distances) else None
-                        ),
-                    }
-                )
+            similar_issues = self._format_query_results(results, 0)
 
             logger.info(
                 f"Found {len(similar_issues)} similar issues for query: {query[:50]}..."
@@ -201,6 +194,93 @@ class IssueVectorStore:
             logger.error(f"Failed to search similar issues: {e}", exc_info=True)
             return []
 
+    async def search_similar_batch(
+        self,
+        queries: list[str],
+        limit: int = 5,
+        filter_metadata: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Search for similar issues for several queries at once.
+
+        Embeds all queries in a single model call and runs one ChromaDB query,
+        instead of one embedding + query round trip per text.
+
+        Args:
+            queries: Search query texts.
+            limit: Maximum number of results per query.
+            filter_metadata: Optional metadata filters applied to every query.
+
+        Returns:
+            One result list per query (same format as search_similar), in
+            input order.
+        """
+        if not queries:
+            return []
+
+        try:
+            # Generate all query embeddings in one batch in thread pool
+            loop = asyncio.get_event_loop()
+            query_embeddings = await loop.run_in_executor(
+                None, self._generate_embeddings, queries
+            )
+
+            # ChromaDB type hints are imprecise for query_embeddings parameter
+            results = self._collection.query(
+                query_embeddings=query_embeddings,  # type: ignore[arg-type]
+                n_results=limit,
+                where=filter_metadata,
+            )
+
+            batch_results = [
+                self._format_query_results(results, index)
+                for index in range(len(queries))
+            ]
+
+            logger.info(f"Found similar issues for {len(queries)} queries in one batch")
+            return batch_results
+
+        except Exception as e:
+            logger.error(f"Failed to batch search similar issues: {e}", exc_info=True)
+            return [[] for _ in queries]
+
+    def _format_query_results(self, results: Any, index: int) -> list[dict[str, Any]]:
+        """Format the results of one query from a ChromaDB query response.
+
+        Args:
+            results: ChromaDB query response.
+            index: Position of the query within the request.
+
+        Returns:
+            List of issues with issue_id, document, metadata and distance.
+        """
+        ids = results["ids"][index] if results["ids"] is not None else []
+        documents = (
+            results["documents"][index] if results["documents"] is not None else []
+        )
+        metadatas = (
+            results["metadatas"][index] if results["metadatas"] is not None else []
+        )
+        distances = (
+            results["distances"][index]
+            if "distances" in results and results["distances"] is not None
+            else None
+        )
+
+        similar_issues = []
+        for i in range(len(ids)):
+            similar_issues.append(
+                {
+                    "issue_id": ids[i],
+                    "document": documents[i] if i < len(documents) else "",
+                    "metadata": metadatas[i] if i < len(metadatas) else {},
+                    "distance": (
+                        distances[i] if distances and i < len(distances) else None
+                    ),
+                }
+            )
+
+        return similar_issues
+
     async def get_issue_embedding(self, issue_id: str) -> list[float] | None:
         """Retrieve the embedding vector for a specific issue.
 
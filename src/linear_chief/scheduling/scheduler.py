@@ -1,5 +1,6 @@
 """APScheduler wrapper for briefing automation."""
 
+from functools import lru_cache
 from typing import Callable, Optional
 from datetime import datetime
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -13,6 +14,20 @@ from linear_chief.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _tz(name: str) -> pytz.BaseTzInfo:
+    """
+    Look up timezone by name (memoized).
+
+    Args:
+        name: Timezone name (e.g., "Europe/Prague")
+
+    Returns:
+        pytz timezone instance
+    """
+    return pytz.timezone(name)
+
+
 class BriefingScheduler:
     """
     Scheduler for automated daily briefings.
@@ -32,7 +47,7 @@ class BriefingScheduler:
             timezone: Timezone name (e.g., "Europe/Prague")
             briefing_time: Daily briefing time in HH:MM format (e.g., "09:00")
         """
-        self.timezone = pytz.timezone(timezone)
+        self.timezone = _tz(timezone)
         self.briefing_time = briefing_time
         self.scheduler: Optional[BackgroundScheduler] = None
         self._is_running = False
@@ -60,16 +75,7 @@ class BriefingScheduler:
         if self._is_running:
             raise RuntimeError("Scheduler is already running")
 
-        # Parse briefing time (HH:MM)
-        try:
-            hour, minute = map(int, self.briefing_time.split(":"))
-        except ValueError as e:
-            logger.error(
-                f"Invalid briefing time format: {self.briefing_time}", exc_info=True
-            )
-            raise ValueError(
-                f"BRIEFING_TIME must be in HH:MM format, got: {self.briefing_time}"
-            ) from e
+        hour, minute = self._parse_briefing_time(self.briefing_time)
 
         # Create scheduler
         self.scheduler = BackgroundScheduler(timezone=self.timezone)
@@ -100,6 +106,62 @@ class BriefingScheduler:
         next_run = self.get_next_run_time()
         logger.info(f"Scheduler started. Next briefing: {next_run}")
 
+    def update_briefing_time(self, briefing_time: str) -> None:
+        """
+        Change the daily briefing time of a running scheduler.
+
+        Reschedules the existing job in place instead of restarting the
+        scheduler.
+
+        Args:
+            briefing_time: New daily briefing time in HH:MM format
+
+        Raises:
+            ValueError: If briefing_time is not in HH:MM format
+            RuntimeError: If scheduler is not running
+        """
+        hour, minute = self._parse_briefing_time(briefing_time)
+
+        if not self._is_running or self.scheduler is None:
+            raise RuntimeError("Scheduler is not running. Use start() first.")
+
+        self.scheduler.reschedule_job(
+            "daily_briefing",
+            trigger=CronTrigger(hour=hour, minute=minute, timezone=self.timezone),
+        )
+        self.briefing_time = briefing_time
+
+        logger.info(
+            f"Briefing time updated to {briefing_time}. "
+            f"Next briefing: {self.get_next_run_time()}"
+        )
+
+    @staticmethod
+    def _parse_briefing_time(briefing_time: str) -> tuple[int, int]:
+        """
+        Parse briefing time string.
+
+        Args:
+            briefing_time: Time in HH:MM format
+
+        Returns:
+            Tuple of (hour, minute)
+
+        Raises:
+            ValueError: If briefing_time is not in HH:MM format
+        """
+        try:
+            hour, minute = map(int, briefing_time.split(":"))
+        except ValueError as e:
+            logger.error(
+                f"Invalid briefing time format: {briefing_time}", exc_info=True
+            )
+            raise ValueError(
+                f"BRIEFING_TIME must be in HH:MM format, got: {briefing_time}"
+            ) from e
+
+        return hour, minute
+
     def stop(self, wait: bool = True) -> None:
         """
         Stop scheduler gracefully.
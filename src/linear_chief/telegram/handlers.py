@@ -10,7 +10,8 @@ Handlers:
 - Text messages - User queries (placeholder for future conversation)
 """
 
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import datetime
 from typing import Optional, Dict
 
 from telegram import Update
@@ -22,6 +23,17 @@ from linear_chief.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# _format_time_ago units: (seconds per unit, name); a unit applies from the
+# previous bound up to its own bound (minutes below 1 hour, hours below 1 day, ...)
+_TIME_AGO_UNITS = (
+    (60, "minute"),
+    (3600, "hour"),
+    (86400, "day"),
+    (7 * 86400, "week"),
+    (30 * 86400, "month"),
+)
+_TIME_AGO_BOUNDS = (3600, 86400, 7 * 86400, 30 * 86400)
+
 
 async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
@@ -810,13 +822,9 @@ async def text_message_handler(
             )
 
             # Build issue_map from fetched issues and DB issues
-            # 1. Extract issue IDs from query
-            from linear_chief.agent.context_builder import (
-                extract_issue_ids,
-                fetch_issue_details,
-            )
+            # 1. Fetch issue IDs already extracted from the query above
+            from linear_chief.agent.context_builder import fetch_issue_details
 
-            issue_ids = extract_issue_ids(user_message)
             if issue_ids:
                 # Fetch real-time issue details
                 fetched_issues = await fetch_issue_details(issue_ids)
@@ -1362,33 +1370,24 @@ def _split_long_message(message: str, max_length: int = 4000) -> list[str]:
     return chunks
 
 
-def _format_time_ago(timestamp: datetime) -> str:
+def _format_time_ago(timestamp: datetime, now: Optional[datetime] = None) -> str:
     """
     Format datetime as human-readable "time ago" string.
 
     Args:
         timestamp: Datetime to format
+        now: Reference time (default: datetime.utcnow())
 
     Returns:
         Human-readable time ago string (e.g., "2 hours ago", "3 days ago")
     """
-    now = datetime.utcnow()
-    delta = now - timestamp
+    if now is None:
+        now = datetime.utcnow()
+    seconds = (now - timestamp).total_seconds()
 
-    if delta < timedelta(minutes=1):
+    if seconds < 60:
         return "just now"
-    elif delta < timedelta(hours=1):
-        minutes = int(delta.total_seconds() / 60)
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    elif delta < timedelta(days=1):
-        hours = int(delta.total_seconds() / 3600)
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif delta < timedelta(days=7):
-        days = delta.days
-        return f"{days} day{'s' if days != 1 else ''} ago"
-    elif delta < timedelta(days=30):
-        weeks = delta.days // 7
-        return f"{weeks} week{'s' if weeks != 1 else ''} ago"
-    else:
-        months = delta.days // 30
-        return f"{months} month{'s' if months != 1 else ''} ago"
+
+    unit_seconds, unit = _TIME_AGO_UNITS[bisect_right(_TIME_AGO_BOUNDS, seconds)]
+    count = int(seconds // unit_seconds)
+    return f"{count} {unit}{'s' if count != 1 else ''} ago"
@@ -0,0 +1,105 @@
+"""Shared fixtures for unit tests (in-memory storage layer, async stubs)."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from linear_chief.storage import (
+    Base,
+    IssueHistoryRepository,
+    BriefingRepository,
+    MetricsRepository,
+)
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """Create in-memory SQLite engine with schema (once per test session)."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _configure_connection(dbapi_connection, connection_record):
+        # pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy
+        # emit BEGIN itself (recipe from the SQLAlchemy SQLite dialect docs)
+        dbapi_connection.isolation_level = None
+
+        # Durability is irrelevant for a throwaway test database
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def session(engine):
+    """
+    Create database session for testing.
+
+    The session joins an outer transaction on a dedicated connection; commits
+    inside the test only release SAVEPOINTs, and everything is rolled back
+    afterwards so each test starts from empty tables. Objects are not expired
+    on commit, so tests read attributes without re-SELECTing them.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def issue_repo(session):
+    """Create IssueHistoryRepository instance."""
+    return IssueHistoryRepository(session)
+
+
+@pytest.fixture
+def briefing_repo(session):
+    """Create BriefingRepository instance."""
+    return BriefingRepository(session)
+
+
+@pytest.fixture
+def metrics_repo(session):
+    """Create MetricsRepository instance."""
+    return MetricsRepository(session)
+
+
+def _areturn(value):
+    """Build a coroutine function stub that always returns value."""
+
+    async def _stub(*args, **kwargs):
+        return value
+
+    return _stub
+
+
+@pytest.fixture(scope="session")
+def areturn():
+    """
+    Provide a factory for async stubs returning a fixed value.
+
+    Use with monkeypatch in place of AsyncMock when a test needs neither
+    call recording nor assertions on calls.
+    """
+    return _areturn
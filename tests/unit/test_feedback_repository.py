@@ -2,27 +2,8 @@
 
 import pytest
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from linear_chief.storage import Base, Feedback, FeedbackRepository
-
-
-@pytest.fixture
-def engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    return engine
-
-
-@pytest.fixture
-def session(engine):
-    """Create database session for testing."""
-    SessionMaker = sessionmaker(bind=engine)
-    session = SessionMaker()
-    yield session
-    session.close()
+from linear_chief.storage import Feedback, FeedbackRepository
 
 
 @pytest.fixture
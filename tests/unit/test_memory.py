@@ -147,6 +147,71 @@ class TestIssueVectorStore:
         assert results[0]["distance"] == 0.1
         assert results[1]["issue_id"] == "PROJ-789"
 
+    @pytest.mark.asyncio
+    async def test_search_similar_batch(
+        self, mock_chroma_client, mock_sentence_transformer
+    ):
+        """Test searching for several queries with one embedding call."""
+        _, mock_collection = mock_chroma_client
+
+        mock_sentence_transformer.encode.return_value.tolist.return_value = [
+            [0.1, 0.2, 0.3],
+            [0.4, 0.5, 0.6],
+        ]
+        mock_collection.query.return_value = {
+            "ids": [["PROJ-456"], ["PROJ-789"]],
+            "documents": [["Issue 456 text"], ["Issue 789 text"]],
+            "metadatas": [[{"status": "Todo"}], [{"status": "Done"}]],
+            "distances": [[0.1], [0.3]],
+        }
+
+        store = IssueVectorStore()
+        results = await store.search_similar_batch(["query one", "query two"], limit=1)
+
+        # One model call and one ChromaDB query for both texts
+        mock_sentence_transformer.encode.assert_called_once()
+        assert mock_sentence_transformer.encode.call_args[0][0] == [
+            "query one",
+            "query two",
+        ]
+        mock_collection.query.assert_called_once()
+        assert mock_collection.query.call_args[1]["query_embeddings"] == [
+            [0.1, 0.2, 0.3],
+            [0.4, 0.5, 0.6],
+        ]
+
+        assert len(results) == 2
+        assert results[0][0]["issue_id"] == "PROJ-456"
+        assert results[0][0]["distance"] == 0.1
+        assert results[1][0]["issue_id"] == "PROJ-789"
+
+    @pytest.mark.asyncio
+    async def test_search_similar_batch_embedding_error(
+        self, mock_chroma_client, mock_sentence_transformer
+    ):
+        """Test that an embedding failure yields empty results per query."""
+        _, mock_collection = mock_chroma_client
+        mock_sentence_transformer.encode.side_effect = RuntimeError("Model error")
+
+        store = IssueVectorStore()
+        results = await store.search_similar_batch(["query one", "query two"])
+
+        assert results == [[], []]
+        mock_collection.query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_similar_batch_empty(
+        self, mock_chroma_client, mock_sentence_transformer
+    ):
+        """Test batch search with no queries skips the model entirely."""
+        _, mock_collection = mock_chroma_client
+
+        store = IssueVectorStore()
+        assert await store.search_similar_batch([]) == []
+
+        mock_sentence_transformer.encode.assert_not_called()
+        mock_collection.query.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_issue_embedding(
         self, mock_chroma_client, mock_sentence_transformer
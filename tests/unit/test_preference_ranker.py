@@ -1,11 +1,21 @@
-"""Unit tests for PreferenceBasedRanker."""
+"""Unit tests for PreferenceBasedRanker.
+
+Tests that only need a fixed engagement score replace get_engagement_score
+with a plain coroutine from the areturn fixture via monkeypatch instead of
+an AsyncMock, which records every call. Keep AsyncMock/patch where a test
+asserts on calls or injects errors.
+"""
 
 import pytest
+from copy import deepcopy
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
 
+from src.linear_chief.intelligence.engagement_tracker import get_engagement_tracker
 from src.linear_chief.intelligence.preference_ranker import (
     PreferenceBasedRanker,
+    ScoringIssue,
+    _normalize_issue,
     extract_topics,
 )
 
@@ -51,14 +61,103 @@ class TestExtractTopics:
 
         assert "backend" in topics
 
+    def test_extract_topics_substring_keywords(self):
+        """Test keywords match inside longer words and with punctuation."""
+        text = "OAuth authentication for CI/CD pipeline"
+        topics = extract_topics(text)
+
+        assert "security" in topics
+        assert "infrastructure" in topics
+
+
+class TestNormalizeIssue:
+    """Tests for _normalize_issue helper function."""
+
+    def test_normalize_nodes_labels(self):
+        """Test normalization of {"nodes": [...]} labels and team."""
+        issue = {
+            "title": "Backend API",
+            "description": "Fix bug",
+            "team": {"name": "Backend Team"},
+            "labels": {"nodes": [{"name": "bug"}, {"name": "urgent"}]},
+        }
+
+        original = deepcopy(issue)
+
+        labels, team_name, text = _normalize_issue(issue)
+
+        assert labels == ["bug", "urgent"]
+        assert team_name == "Backend Team"
+        assert text == "Backend API Fix bug"
+        # The caller's issue is left untouched
+        assert issue == original
+
+    def test_normalize_list_labels_missing_team(self):
+        """Test normalization of list labels with missing team."""
+        issue = {"labels": [{"name": "bug"}, {}], "team": None}
+
+        labels, team_name, _ = _normalize_issue(issue)
+
+        assert labels == ["bug"]
+        assert team_name == ""
+
+
+class TestScoringIssue:
+    """Tests for ScoringIssue dataclass."""
+
+    def test_from_raw(self):
+        """Test building a ScoringIssue from an issue dictionary."""
+        issue = {
+            "identifier": "TEST-1",
+            "title": "Backend API",
+            "description": "Fix bug",
+            "team": {"name": "Backend Team"},
+            "labels": [{"name": "bug"}],
+            "_analysis": {"priority": 8},
+        }
+
+        scoring = ScoringIssue.from_raw(issue)
+
+        assert scoring.identifier == "TEST-1"
+        assert scoring.text == "Backend API Fix bug"
+        assert scoring.team_name == "Backend Team"
+        assert scoring.labels == ["bug"]
+        assert scoring.base_priority == 8.0
+
+    def test_from_raw_base_priorities_override(self):
+        """Test explicit base priorities take precedence over _analysis."""
+        issue = {"identifier": "TEST-1", "_analysis": {"priority": 8}}
+
+        scoring = ScoringIssue.from_raw(issue, {"TEST-1": 3.0})
+
+        assert scoring.base_priority == 3.0
+
+
+SAMPLE_ISSUE = {
+    "identifier": "TEST-1",
+    "title": "Backend API optimization",
+    "description": "Improve backend performance",
+    "team": {"name": "Backend Team"},
+    "labels": {"nodes": [{"name": "bug"}, {"name": "performance"}]},
+}
+
+
+@pytest.fixture(scope="module")
+def shared_ranker():
+    """Create one PreferenceBasedRanker instance for the whole module."""
+    return PreferenceBasedRanker(user_id="test@example.com")
+
 
 class TestPreferenceBasedRanker:
     """Tests for PreferenceBasedRanker class."""
 
     @pytest.fixture
-    def ranker(self):
-        """Create PreferenceBasedRanker instance."""
-        return PreferenceBasedRanker(user_id="test@example.com")
+    def ranker(self, shared_ranker):
+        """Reset the shared PreferenceBasedRanker state for each test."""
+        shared_ranker._cached_preferences = None
+        shared_ranker.preference_learner = None
+        shared_ranker.engagement_tracker = get_engagement_tracker()
+        return shared_ranker
 
     @pytest.fixture
     def mock_preferences(self):
@@ -86,258 +185,166 @@ class TestPreferenceBasedRanker:
     @pytest.fixture
     def sample_issue(self):
         """Sample issue dictionary."""
-        return {
-            "identifier": "TEST-1",
-            "title": "Backend API optimization",
-            "description": "Improve backend performance",
-            "team": {"name": "Backend Team"},
-            "labels": {"nodes": [{"name": "bug"}, {"name": "performance"}]},
-        }
+        return SAMPLE_ISSUE
 
     @pytest.mark.asyncio
-    async def test_calculate_personalized_priority_high_preference(
-        self, ranker, sample_issue, mock_preferences
+    @pytest.mark.parametrize(
+        "issue,base_priority,engagement,expected",
+        [
+            # topic avg 0.85, team 0.9, label avg 0.725 -> boost 0.325
+            # 5.0 * (1 + 0.325) = 6.625
+            (SAMPLE_ISSUE, 5.0, 0.0, 6.625),
+            # topic avg 0.25, team 0.4, label 0.2 -> boost -0.217
+            # 5.0 * (1 - 0.217) = 3.915
+            (
+                {
+                    "identifier": "TEST-2",
+                    "title": "Frontend CSS documentation",
+                    "description": "Update CSS docs",
+                    "team": {"name": "Frontend Team"},
+                    "labels": {"nodes": [{"name": "documentation"}]},
+                },
+                5.0,
+                0.0,
+                3.92,
+            ),
+            # All scores default to neutral 0.5 -> no boost
+            (
+                {
+                    "identifier": "TEST-3",
+                    "title": "General task",
+                    "description": "General work",
+                    "team": {"name": "Unknown Team"},
+                    "labels": {"nodes": [{"name": "feature"}]},
+                },
+                7.0,
+                0.0,
+                7.0,
+            ),
+            # boost 0.325 + engagement 0.8 * 0.3 -> 8.0 * 1.565 = 12.52 -> capped
+            (SAMPLE_ISSUE, 8.0, 0.8, 10.0),
+            (SAMPLE_ISSUE, 9.0, 1.0, 10.0),
+        ],
+        ids=["high_preference", "low_preference", "neutral", "with_engagement", "capped_at_10"],
+    )
+    async def test_calculate_personalized_priority(
+        self,
+        ranker,
+        mock_preferences,
+        monkeypatch,
+        areturn,
+        issue,
+        base_priority,
+        engagement,
+        expected,
     ):
-        """Test personalized priority with high preference."""
-        # Mock preferences and engagement
+        """Test personalized priority across preference and engagement levels."""
         ranker._cached_preferences = mock_preferences
 
-        with patch.object(ranker, "get_engagement_score", return_value=0.0) as mock_engagement:
-            base_priority = 5.0
-            personalized = await ranker.calculate_personalized_priority(
-                issue=sample_issue,
-                base_priority=base_priority,
-            )
-
-            # With high topic (0.9, 0.8 avg=0.85), team (0.9), label (0.95, 0.5 avg=0.725):
-            # avg_preference = (0.85 + 0.9 + 0.725) / 3 = 0.825
-            # preference_boost = 0.825 - 0.5 = 0.325
-            # engagement_boost = 0.0
-            # personalized = 5.0 * (1 + 0.325 + 0.0) = 6.625
-
-            assert personalized == pytest.approx(6.625, abs=0.1)
+        monkeypatch.setattr(ranker, "get_engagement_score", areturn(engagement))
 
-    @pytest.mark.asyncio
-    async def test_calculate_personalized_priority_low_preference(self, ranker, mock_preferences):
-        """Test personalized priority with low preference."""
-        ranker._cached_preferences = mock_preferences
-
-        # Issue with low-preference topics
-        issue = {
-            "identifier": "TEST-2",
-            "title": "Frontend CSS documentation",
-            "description": "Update CSS docs",
-            "team": {"name": "Frontend Team"},
-            "labels": {"nodes": [{"name": "documentation"}]},
-        }
-
-        with patch.object(ranker, "get_engagement_score", return_value=0.0):
-            base_priority = 5.0
-            personalized = await ranker.calculate_personalized_priority(
-                issue=issue,
-                base_priority=base_priority,
-            )
-
-            # With low topic (0.3, 0.2 avg=0.25), team (0.4), label (0.2) preferences:
-            # avg_preference = (0.25 + 0.4 + 0.2) / 3 = 0.283
-            # preference_boost = 0.283 - 0.5 = -0.217
-            # engagement_boost = 0.0
-            # personalized = 5.0 * (1 - 0.217 + 0.0) = 3.915
-
-            assert personalized == pytest.approx(3.92, abs=0.1)
-
-    @pytest.mark.asyncio
-    async def test_calculate_personalized_priority_neutral_preference(
-        self, ranker, mock_preferences
-    ):
-        """Test personalized priority with neutral preference."""
-        ranker._cached_preferences = mock_preferences
-
-        # Issue with neutral preferences
-        issue = {
-            "identifier": "TEST-3",
-            "title": "General task",
-            "description": "General work",
-            "team": {"name": "Unknown Team"},
-            "labels": {"nodes": [{"name": "feature"}]},
-        }
-
-        with patch.object(ranker, "get_engagement_score", return_value=0.0):
-            base_priority = 7.0
-            personalized = await ranker.calculate_personalized_priority(
-                issue=issue,
-                base_priority=base_priority,
-            )
-
-            # With neutral preferences (all default to 0.5):
-            # avg_preference = 0.5
-            # preference_boost = 0.5 - 0.5 = 0.0
-            # engagement_boost = 0.0
-            # personalized = 7.0 * (1 + 0.0 + 0.0) = 7.0
-
-            assert personalized == pytest.approx(7.0, abs=0.1)
-
-    @pytest.mark.asyncio
-    async def test_calculate_personalized_priority_with_engagement(
-        self, ranker, sample_issue, mock_preferences
-    ):
-        """Test personalized priority with engagement boost."""
-        ranker._cached_preferences = mock_preferences
-
-        with patch.object(ranker, "get_engagement_score", return_value=0.8):
-            base_priority = 8.0
-            personalized = await ranker.calculate_personalized_priority(
-                issue=sample_issue,
-                base_priority=base_priority,
-            )
-
-            # With high preferences (avg ~0.916) and high engagement (0.8):
-            # preference_boost = 0.416
-            # engagement_boost = 0.8 * 0.3 = 0.24
-            # personalized = 8.0 * (1 + 0.416 + 0.24) = 13.248 -> capped at 10.0
-
-            assert personalized == 10.0
-
-    @pytest.mark.asyncio
-    async def test_calculate_personalized_priority_capped_at_10(
-        self, ranker, sample_issue, mock_preferences
-    ):
-        """Test that personalized priority is capped at 10.0."""
-        ranker._cached_preferences = mock_preferences
-
-        with patch.object(ranker, "get_engagement_score", return_value=1.0):
-            base_priority = 9.0
-            personalized = await ranker.calculate_personalized_priority(
-                issue=sample_issue,
-                base_priority=base_priority,
-            )
-
-            # Should be capped at 10.0
-            assert personalized == 10.0
-
-    @pytest.mark.asyncio
-    async def test_get_topic_score_with_topics(self, ranker, mock_preferences):
-        """Test get_topic_score with detected topics."""
-        ranker._cached_preferences = mock_preferences
-
-        issue = {
-            "identifier": "TEST-1",
-            "title": "Backend API optimization",
-            "description": "Improve backend performance",
-        }
-
-        score = await ranker.get_topic_score(issue)
+        personalized = await ranker.calculate_personalized_priority(
+            issue=issue,
+            base_priority=base_priority,
+        )
 
-        # Should detect "backend" (0.9) and "performance" (0.8)
-        # Average: (0.9 + 0.8) / 2 = 0.85
-        assert score == pytest.approx(0.85, abs=0.05)
+        assert personalized == pytest.approx(expected, abs=0.1)
 
     @pytest.mark.asyncio
-    async def test_get_topic_score_no_topics(self, ranker, mock_preferences):
-        """Test get_topic_score with no detected topics."""
+    @pytest.mark.parametrize(
+        "issue,expected",
+        [
+            # "backend" (0.9) and "performance" (0.8) -> 0.85
+            (
+                {
+                    "identifier": "TEST-1",
+                    "title": "Backend API optimization",
+                    "description": "Improve backend performance",
+                },
+                0.85,
+            ),
+            (
+                {
+                    "identifier": "TEST-1",
+                    "title": "Generic task",
+                    "description": "Some generic work",
+                },
+                0.5,
+            ),
+        ],
+        ids=["with_topics", "no_topics"],
+    )
+    async def test_get_topic_score(self, ranker, mock_preferences, issue, expected):
+        """Test get_topic_score averages detected topic preferences."""
         ranker._cached_preferences = mock_preferences
 
-        issue = {
-            "identifier": "TEST-1",
-            "title": "Generic task",
-            "description": "Some generic work",
-        }
-
         score = await ranker.get_topic_score(issue)
 
-        # Should return neutral score
-        assert score == 0.5
+        assert score == pytest.approx(expected, abs=0.05)
 
     @pytest.mark.asyncio
-    async def test_get_team_score_with_preference(self, ranker, mock_preferences):
-        """Test get_team_score with team preference."""
+    @pytest.mark.parametrize(
+        "issue,expected",
+        [
+            ({"identifier": "TEST-1", "team": {"name": "Backend Team"}}, 0.9),
+            ({"identifier": "TEST-1", "team": {"name": "Unknown Team"}}, 0.5),
+            ({"identifier": "TEST-1", "team": None}, 0.5),
+        ],
+        ids=["with_preference", "no_preference", "missing_team"],
+    )
+    async def test_get_team_score(self, ranker, mock_preferences, issue, expected):
+        """Test get_team_score looks up team preference (neutral if unknown)."""
         ranker._cached_preferences = mock_preferences
 
-        issue = {
-            "identifier": "TEST-1",
-            "team": {"name": "Backend Team"},
-        }
-
-        score = await ranker.get_team_score(issue)
-
-        # Should match "Backend Team" preference
-        assert score == 0.9
-
-    @pytest.mark.asyncio
-    async def test_get_team_score_no_preference(self, ranker, mock_preferences):
-        """Test get_team_score with no team preference."""
-        ranker._cached_preferences = mock_preferences
-
-        issue = {
-            "identifier": "TEST-1",
-            "team": {"name": "Unknown Team"},
-        }
-
         score = await ranker.get_team_score(issue)
 
-        # Should return neutral score
-        assert score == 0.5
+        assert score == expected
 
     @pytest.mark.asyncio
-    async def test_get_team_score_missing_team(self, ranker, mock_preferences):
-        """Test get_team_score with missing team."""
+    async def test_score_views_unknown_keys_not_inserted(self, ranker, mock_preferences):
+        """Test neutral lookups of unknown keys leave the score views unchanged."""
         ranker._cached_preferences = mock_preferences
+        views = ranker._score_views()
+        sizes = [len(view) for view in views]
 
-        issue = {
-            "identifier": "TEST-1",
-            "team": None,
-        }
-
-        score = await ranker.get_team_score(issue)
-
-        # Should return neutral score
-        assert score == 0.5
-
-    @pytest.mark.asyncio
-    async def test_get_label_score_with_preferences(self, ranker, mock_preferences):
-        """Test get_label_score with label preferences."""
-        ranker._cached_preferences = mock_preferences
-
-        issue = {
-            "identifier": "TEST-1",
-            "labels": {"nodes": [{"name": "bug"}, {"name": "feature"}]},
-        }
-
-        score = await ranker.get_label_score(issue)
-
-        # Should average "bug" (0.95) and "feature" (0.5)
-        # Average: (0.95 + 0.5) / 2 = 0.725
-        assert score == pytest.approx(0.725, abs=0.01)
-
-    @pytest.mark.asyncio
-    async def test_get_label_score_no_labels(self, ranker, mock_preferences):
-        """Test get_label_score with no labels."""
-        ranker._cached_preferences = mock_preferences
+        await ranker.get_team_score({"team": {"name": "Unknown Team"}})
+        await ranker.get_label_score({"labels": [{"name": "unknown"}]})
 
-        issue = {
-            "identifier": "TEST-1",
-            "labels": {"nodes": []},
-        }
+        # Same preferences object -> same views, with no keys added
+        assert all(a is b for a, b in zip(ranker._score_views(), views))
+        assert [len(view) for view in views] == sizes
 
-        score = await ranker.get_label_score(issue)
+    def test_score_views_cached_without_preferences(self, ranker):
+        """Test views are built once while no preferences are loaded."""
+        first = ranker._score_views()
 
-        # Should return neutral score
-        assert score == 0.5
+        assert all(a is b for a, b in zip(ranker._score_views(), first))
+        assert ranker._has_any_prefs is False
 
     @pytest.mark.asyncio
-    async def test_get_label_score_list_format(self, ranker, mock_preferences):
-        """Test get_label_score with list-formatted labels."""
+    @pytest.mark.parametrize(
+        "issue,expected",
+        [
+            # "bug" (0.95) and "feature" (0.5) -> 0.725
+            (
+                {
+                    "identifier": "TEST-1",
+                    "labels": {"nodes": [{"name": "bug"}, {"name": "feature"}]},
+                },
+                0.725,
+            ),
+            ({"identifier": "TEST-1", "labels": {"nodes": []}}, 0.5),
+            ({"identifier": "TEST-1", "labels": [{"name": "bug"}]}, 0.95),
+        ],
+        ids=["with_preferences", "no_labels", "list_format"],
+    )
+    async def test_get_label_score(self, ranker, mock_preferences, issue, expected):
+        """Test get_label_score averages label preferences for both label formats."""
         ranker._cached_preferences = mock_preferences
 
-        issue = {
-            "identifier": "TEST-1",
-            "labels": [{"name": "bug"}],
-        }
-
         score = await ranker.get_label_score(issue)
 
-        # Should match "bug" preference
-        assert score == 0.95
+        assert score == pytest.approx(expected, abs=0.01)
 
     @pytest.mark.asyncio
     async def test_get_engagement_score(self, ranker):
@@ -356,6 +363,13 @@ class TestPreferenceBasedRanker:
             user_id="test@example.com", issue_id="TEST-1"
         )
 
+    def test_engagement_tracker_shared_across_rankers(self, ranker):
+        """Test rankers share one EngagementTracker by default."""
+        other = PreferenceBasedRanker(user_id="other@example.com")
+
+        assert ranker.engagement_tracker is not None
+        assert ranker.engagement_tracker is other.engagement_tracker
+
     @pytest.mark.asyncio
     async def test_get_engagement_score_missing_identifier(self, ranker):
         """Test get_engagement_score with missing identifier."""
@@ -367,7 +381,7 @@ class TestPreferenceBasedRanker:
         assert score == 0.0
 
     @pytest.mark.asyncio
-    async def test_rank_issues(self, ranker, mock_preferences):
+    async def test_rank_issues(self, ranker, mock_preferences, monkeypatch, areturn):
         """Test rank_issues method."""
         ranker._cached_preferences = mock_preferences
 
@@ -390,17 +404,20 @@ class TestPreferenceBasedRanker:
             },
         ]
 
-        with patch.object(ranker, "get_engagement_score", return_value=0.0):
-            ranked = await ranker.rank_issues(issues)
+        monkeypatch.setattr(ranker, "get_engagement_score", areturn(0.0))
+
+        ranked = await ranker.rank_issues(issues)
 
-            # Backend issue should rank higher due to preferences
-            assert len(ranked) == 2
-            assert ranked[0][0]["identifier"] == "TEST-2"  # Backend issue first
-            assert ranked[1][0]["identifier"] == "TEST-1"  # Frontend issue second
-            assert ranked[0][1] > ranked[1][1]  # Higher priority
+        # Backend issue should rank higher due to preferences
+        assert len(ranked) == 2
+        assert ranked[0][0]["identifier"] == "TEST-2"  # Backend issue first
+        assert ranked[1][0]["identifier"] == "TEST-1"  # Frontend issue second
+        assert ranked[0][1] > ranked[1][1]  # Higher priority
 
     @pytest.mark.asyncio
-    async def test_rank_issues_with_base_priorities(self, ranker, mock_preferences):
+    async def test_rank_issues_with_base_priorities(
+        self, ranker, mock_preferences, monkeypatch, areturn
+    ):
         """Test rank_issues with explicit base priorities."""
         ranker._cached_preferences = mock_preferences
 
@@ -416,11 +433,36 @@ class TestPreferenceBasedRanker:
 
         base_priorities = {"TEST-1": 7.0}
 
-        with patch.object(ranker, "get_engagement_score", return_value=0.0):
-            ranked = await ranker.rank_issues(issues, base_priorities)
+        monkeypatch.setattr(ranker, "get_engagement_score", areturn(0.0))
 
-            assert len(ranked) == 1
-            assert ranked[0][1] > 7.0  # Should be boosted
+        ranked = await ranker.rank_issues(issues, base_priorities)
+
+        assert len(ranked) == 1
+        assert ranked[0][1] > 7.0  # Should be boosted
+
+    @pytest.mark.asyncio
+    async def test_rank_issues_top_k(self, ranker, mock_preferences, monkeypatch, areturn):
+        """Test rank_issues returns only the top_k highest priorities."""
+        ranker._cached_preferences = mock_preferences
+
+        issues = [
+            {
+                "identifier": f"TEST-{i}",
+                "title": "Generic task",
+                "description": "",
+                "_analysis": {"priority": i % 10},
+            }
+            for i in range(100)
+        ]
+
+        monkeypatch.setattr(ranker, "get_engagement_score", areturn(0.0))
+
+        ranked = await ranker.rank_issues(issues, top_k=5)
+        full = await ranker.rank_issues(issues)
+
+        assert len(ranked) == 5
+        assert [priority for _, priority in ranked] == [9.0] * 5
+        assert ranked == full[:5]
 
     @pytest.mark.asyncio
     async def test_get_preference_context(self, ranker, mock_preferences):
@@ -520,6 +562,24 @@ class TestPreferenceBasedRanker:
         # Should return base priority (no boost from preferences or engagement)
         assert personalized == pytest.approx(5.0, abs=0.1)
 
+    @pytest.mark.asyncio
+    async def test_no_preferences_skips_engagement(self, ranker, sample_issue):
+        """Test that empty preferences return base priority without engagement lookup."""
+        ranker._cached_preferences = {
+            "topic_scores": {},
+            "team_scores": {},
+            "label_scores": {},
+        }
+
+        with patch.object(ranker, "get_engagement_score", return_value=0.8) as mock_engagement:
+            personalized = await ranker.calculate_personalized_priority(
+                issue=sample_issue,
+                base_priority=6.0,
+            )
+
+        assert personalized == 6.0
+        mock_engagement.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_error_handling_in_calculate_priority(
         self, ranker, sample_issue, mock_preferences
@@ -1,31 +1,54 @@
 """Unit tests for scheduler."""
 
 import pytest
-import time
+import threading
+from typing import Optional
 from unittest.mock import Mock
 
 from linear_chief.scheduling import BriefingScheduler
 
 
+def _make_job(error: Optional[Exception] = None) -> Mock:
+    """
+    Create a mock job that signals ``job.event`` when it runs.
+
+    Tests wait on the event instead of a fixed delay. If ``error`` is
+    given, the job sets the event and then raises it.
+    """
+    event = threading.Event()
+
+    def _run(*args, **kwargs):
+        event.set()
+        if error is not None:
+            raise error
+
+    job = Mock(side_effect=_run)
+    job.event = event
+    return job
+
+
 @pytest.fixture
 def mock_job():
     """Create a mock job function."""
-    return Mock()
+    return _make_job()
 
 
 class TestBriefingScheduler:
     """Tests for BriefingScheduler."""
 
-    def test_initialization(self):
-        """Test scheduler initialization."""
-        scheduler = BriefingScheduler(
+    @pytest.fixture(scope="class")
+    def idle_scheduler(self):
+        """Create a scheduler shared by tests that never start it."""
+        return BriefingScheduler(
             timezone="Europe/Prague",
             briefing_time="09:00",
         )
 
-        assert scheduler.timezone.zone == "Europe/Prague"
-        assert scheduler.briefing_time == "09:00"
-        assert not scheduler.is_running()
+    def test_initialization(self, idle_scheduler):
+        """Test scheduler initialization."""
+        assert str(idle_scheduler.timezone) == "Europe/Prague"
+        assert idle_scheduler.briefing_time == "09:00"
+        assert not idle_scheduler.is_running()
 
     def test_invalid_briefing_time_format(self, mock_job):
         """Test scheduler with invalid time format."""
@@ -73,19 +96,15 @@ class TestBriefingScheduler:
         scheduler.stop()
         assert not scheduler.is_running()
 
-    def test_stop_not_running(self):
+    def test_stop_not_running(self, idle_scheduler):
         """Test stopping scheduler when not running."""
-        scheduler = BriefingScheduler(briefing_time="09:00")
-
         # Should not raise error
-        scheduler.stop()
-        assert not scheduler.is_running()
+        idle_scheduler.stop()
+        assert not idle_scheduler.is_running()
 
-    def test_get_next_run_time_not_running(self):
+    def test_get_next_run_time_not_running(self, idle_scheduler):
         """Test getting next run time when scheduler not running."""
-        scheduler = BriefingScheduler(briefing_time="09:00")
-
-        next_run = scheduler.get_next_run_time()
+        next_run = idle_scheduler.get_next_run_time()
         assert next_run is None
 
     def test_trigger_now(self, mock_job):
@@ -99,7 +118,7 @@ class TestBriefingScheduler:
             scheduler.trigger_now()
 
             # Wait for job execution
-            time.sleep(2)
+            assert mock_job.event.wait(timeout=5)
 
             # Job should have been called
             assert mock_job.call_count >= 1
@@ -107,12 +126,10 @@ class TestBriefingScheduler:
         finally:
             scheduler.stop()
 
-    def test_trigger_now_not_running(self):
+    def test_trigger_now_not_running(self, idle_scheduler):
         """Test triggering job when scheduler not running."""
-        scheduler = BriefingScheduler(briefing_time="09:00")
-
         with pytest.raises(RuntimeError, match="Scheduler is not running"):
-            scheduler.trigger_now()
+            idle_scheduler.trigger_now()
 
     def test_timezone_handling(self, mock_job):
         """Test scheduler with different timezones."""
@@ -127,7 +144,7 @@ class TestBriefingScheduler:
             next_run = scheduler_utc.get_next_run_time()
 
             assert next_run is not None
-            assert next_run.tzinfo.zone == "UTC"
+            assert str(next_run.tzinfo) == "UTC"
 
         finally:
             scheduler_utc.stop()
@@ -143,10 +160,7 @@ class TestBriefingScheduler:
             next_run = scheduler_eastern.get_next_run_time()
 
             assert next_run is not None
-            assert (
-                "Eastern" in next_run.tzinfo.zone
-                or next_run.tzinfo.zone == "US/Eastern"
-            )
+            assert "Eastern" in str(next_run.tzinfo)
 
         finally:
             scheduler_eastern.stop()
@@ -158,7 +172,7 @@ class TestBriefingScheduler:
         try:
             scheduler.start(mock_job)
             scheduler.trigger_now()
-            time.sleep(2)
+            assert mock_job.event.wait(timeout=5)
 
             # Verify job was executed via listener logs
             # (actual verification would require inspecting logs)
@@ -181,30 +195,57 @@ class TestBriefingScheduler:
         # Valid formats
         valid_times = ["00:00", "09:30", "23:59", "12:00"]
 
-        for time_str in valid_times:
-            scheduler = BriefingScheduler(briefing_time=time_str)
-            try:
-                scheduler.start(mock_job)
+        scheduler = BriefingScheduler(briefing_time="00:00")
+        try:
+            scheduler.start(mock_job)
+
+            for time_str in valid_times:
+                scheduler.update_briefing_time(time_str)
                 next_run = scheduler.get_next_run_time()
 
                 hour, minute = map(int, time_str.split(":"))
                 assert next_run.hour == hour
                 assert next_run.minute == minute
+                assert scheduler.briefing_time == time_str
+
+        finally:
+            scheduler.stop()
+
+    def test_update_briefing_time_not_running(self, idle_scheduler):
+        """Test updating briefing time when scheduler not running."""
+        with pytest.raises(RuntimeError, match="Scheduler is not running"):
+            idle_scheduler.update_briefing_time("10:00")
+
+        assert idle_scheduler.briefing_time == "09:00"
 
-            finally:
-                scheduler.stop()
+    def test_update_briefing_time_invalid_format(self, mock_job):
+        """Test updating briefing time with invalid format."""
+        scheduler = BriefingScheduler(briefing_time="09:00")
+
+        try:
+            scheduler.start(mock_job)
+
+            with pytest.raises(
+                ValueError, match="BRIEFING_TIME must be in HH:MM format"
+            ):
+                scheduler.update_briefing_time("invalid")
+
+            assert scheduler.briefing_time == "09:00"
+
+        finally:
+            scheduler.stop()
 
     def test_job_error_listener(self, mock_job):
         """Test job error listener handles exceptions."""
         # Create job that raises exception
-        error_job = Mock(side_effect=Exception("Test error"))
+        error_job = _make_job(error=Exception("Test error"))
 
         scheduler = BriefingScheduler(briefing_time="23:59")
 
         try:
             scheduler.start(error_job)
             scheduler.trigger_now()
-            time.sleep(2)
+            assert error_job.event.wait(timeout=5)
 
             # Job should have been called and error logged
             assert error_job.call_count >= 1
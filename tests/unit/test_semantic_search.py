@@ -1,191 +1,275 @@
 """Unit tests for semantic search service."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from linear_chief.intelligence import semantic_search
 from linear_chief.intelligence.semantic_search import (
     SemanticSearchService,
     calculate_similarity_percentage,
 )
 
+# Shared read-only fixtures for find_similar_issues tests
+_CTX_AI1799 = {
+    "issue_id": "AI-1799",
+    "title": "OAuth2 Authentication",
+    "description": "Implement OAuth2 flow",
+    "state": "In Progress",
+    "team": "AI",
+    "url": "https://linear.app/ai/AI-1799",
+}
+_HIT_AI1799_SELF = {
+    "issue_id": "AI-1799",
+    "distance": 0.0,
+    "metadata": {
+        "title": "OAuth2 Authentication",
+        "state": "In Progress",
+        "team_name": "AI",
+        "url": "https://linear.app/ai/AI-1799",
+    },
+}
+_HIT_AI1820 = {
+    "issue_id": "AI-1820",
+    "distance": 0.26,  # 87% similarity
+    "metadata": {
+        "title": "OIDC Authentication",
+        "state": "Todo",
+        "team_name": "AI",
+        "url": "https://linear.app/ai/AI-1820",
+    },
+}
+
+# Shared read-only results for format_similarity_results tests
+_RESULT_AI1820 = {
+    "issue_id": "AI-1820",
+    "title": "OAuth2 implementation",
+    "similarity": 0.87,
+    "url": "https://linear.app/ai/AI-1820",
+    "state": "In Progress",
+    "team": "AI",
+}
+_RESULT_AI1799 = {
+    "issue_id": "AI-1799",
+    "title": "Auth refactor",
+    "similarity": 0.73,
+    "url": "https://linear.app/ai/AI-1799",
+    "state": "Done",
+    "team": "AI",
+}
+
+
+# Module-level dependencies of semantic_search replaced by mocks
+_PATCHED_DEPENDENCIES = (
+    "IssueVectorStore",
+    "get_session_maker",
+    "get_db_session",
+    "IssueHistoryRepository",
+    "LinearClient",
+)
 
-class TestSimilarityCalculation:
-    """Test similarity percentage calculation."""
 
-    def test_identical_vectors(self):
-        """Test distance of 0 gives 100% similarity."""
-        assert calculate_similarity_percentage(0.0) == 100.0
+@pytest.fixture(autouse=True, scope="module")
+def mocks():
+    """
+    Install mocks for semantic_search dependencies once per module.
+
+    Each dependency is available under its own name; ``vector_store`` is the
+    instance returned by the mocked IssueVectorStore.
+    """
+    namespace = SimpleNamespace(**{name: MagicMock() for name in _PATCHED_DEPENDENCIES})
+    with pytest.MonkeyPatch.context() as mp:
+        for name in _PATCHED_DEPENDENCIES:
+            mp.setattr(semantic_search, name, getattr(namespace, name))
+        yield namespace
 
-    def test_opposite_vectors(self):
-        """Test distance of 2 gives 0% similarity."""
-        assert calculate_similarity_percentage(2.0) == 0.0
 
-    def test_midpoint_similarity(self):
-        """Test distance of 1 gives 50% similarity."""
-        assert calculate_similarity_percentage(1.0) == 50.0
+@pytest.fixture(autouse=True)
+def reset_mocks(mocks):
+    """Reset shared dependency mocks and rebuild the async vector store API."""
+    for name in _PATCHED_DEPENDENCIES:
+        getattr(mocks, name).reset_mock(return_value=True, side_effect=True)
 
-    def test_75_percent_similarity(self):
-        """Test distance of 0.5 gives 75% similarity."""
-        assert calculate_similarity_percentage(0.5) == 75.0
+    mocks.vector_store = mocks.IssueVectorStore.return_value
+    mocks.vector_store.search_similar = AsyncMock()
+    mocks.vector_store.search_similar_batch = AsyncMock()
 
-    def test_90_percent_similarity(self):
-        """Test distance of 0.2 gives 90% similarity."""
-        assert calculate_similarity_percentage(0.2) == 90.0
 
-    def test_negative_distance_clamped(self):
-        """Test negative distance is clamped to 0."""
-        assert calculate_similarity_percentage(-0.5) == 100.0
+class TestSimilarityCalculation:
+    """Test similarity percentage calculation."""
 
-    def test_large_distance_clamped(self):
-        """Test distance > 2 is clamped to 2."""
-        assert calculate_similarity_percentage(3.0) == 0.0
+    @pytest.mark.parametrize(
+        "distance,expected",
+        [
+            pytest.param(0.0, 100.0, id="identical"),
+            pytest.param(2.0, 0.0, id="opposite"),
+            pytest.param(1.0, 50.0, id="midpoint"),
+            pytest.param(0.5, 75.0, id="75-percent"),
+            pytest.param(0.2, 90.0, id="90-percent"),
+            pytest.param(-0.5, 100.0, id="negative-clamped"),
+            pytest.param(3.0, 0.0, id="large-clamped"),
+        ],
+    )
+    def test_similarity(self, distance, expected):
+        """Test distance to similarity conversion (clamped to 0-2)."""
+        assert calculate_similarity_percentage(distance) == expected
 
 
 class TestSemanticSearchService:
     """Test SemanticSearchService class."""
 
     @pytest.fixture
-    def mock_vector_store(self):
-        """Mock IssueVectorStore."""
-        with patch(
-            "linear_chief.intelligence.semantic_search.IssueVectorStore"
-        ) as mock:
-            # Make search_similar async
-            mock.return_value.search_similar = AsyncMock()
-            yield mock.return_value
-
-    @pytest.fixture
-    def service(self, mock_vector_store):
+    def service(self):
         """Create SemanticSearchService instance with mocked dependencies."""
         return SemanticSearchService()
 
     @pytest.mark.asyncio
-    async def test_find_similar_issues_success(self, service, mock_vector_store):
+    async def test_find_similar_issues_success(
+        self, service, mocks, monkeypatch, areturn
+    ):
         """Test finding similar issues successfully."""
         # Mock get_issue_context
-        with patch.object(
-            service, "get_issue_context", new_callable=AsyncMock
-        ) as mock_context:
-            mock_context.return_value = {
-                "issue_id": "AI-1799",
-                "title": "OAuth2 Authentication",
-                "description": "Implement OAuth2 flow",
-                "state": "In Progress",
-                "team": "AI",
-                "url": "https://linear.app/ai/AI-1799",
-            }
+        monkeypatch.setattr(service, "get_issue_context", areturn(_CTX_AI1799))
 
-            # Mock vector store search
-            mock_vector_store.search_similar.return_value = [
-                {
-                    "issue_id": "AI-1799",  # Self-match (should be filtered)
-                    "distance": 0.0,
-                    "metadata": {
-                        "title": "OAuth2 Authentication",
-                        "state": "In Progress",
-                        "team_name": "AI",
-                        "url": "https://linear.app/ai/AI-1799",
-                    },
-                },
-                {
-                    "issue_id": "AI-1820",
-                    "distance": 0.26,  # 87% similarity
-                    "metadata": {
-                        "title": "OIDC Authentication",
-                        "state": "Todo",
-                        "team_name": "AI",
-                        "url": "https://linear.app/ai/AI-1820",
-                    },
-                },
-                {
-                    "issue_id": "AI-1805",
-                    "distance": 0.54,  # 73% similarity
-                    "metadata": {
-                        "title": "Login flow refactor",
-                        "state": "Done",
-                        "team_name": "AI",
-                        "url": "https://linear.app/ai/AI-1805",
-                    },
+        # Mock vector store search
+        mocks.vector_store.search_similar.return_value = [
+            _HIT_AI1799_SELF,  # Self-match (should be filtered)
+            _HIT_AI1820,  # 87% similarity
+            {
+                "issue_id": "AI-1805",
+                "distance": 0.54,  # 73% similarity
+                "metadata": {
+                    "title": "Login flow refactor",
+                    "state": "Done",
+                    "team_name": "AI",
+                    "url": "https://linear.app/ai/AI-1805",
                 },
-            ]
+            },
+        ]
 
-            # Execute
-            results = await service.find_similar_issues("AI-1799", limit=5)
+        # Execute
+        results = await service.find_similar_issues("AI-1799", limit=5)
 
-            # Verify
-            assert len(results) == 2  # Excludes self-match
-            assert results[0]["issue_id"] == "AI-1820"
-            assert results[0]["similarity"] == pytest.approx(0.87, abs=0.01)
-            assert results[0]["title"] == "OIDC Authentication"
-            assert results[1]["issue_id"] == "AI-1805"
-            assert results[1]["similarity"] == pytest.approx(0.73, abs=0.01)
+        # Verify
+        assert len(results) == 2  # Excludes self-match
+        assert results[0]["issue_id"] == "AI-1820"
+        assert results[0]["similarity"] == pytest.approx(0.87, abs=0.01)
+        assert results[0]["title"] == "OIDC Authentication"
+        assert results[1]["issue_id"] == "AI-1805"
+        assert results[1]["similarity"] == pytest.approx(0.73, abs=0.01)
 
     @pytest.mark.asyncio
     async def test_find_similar_issues_min_similarity_filter(
-        self, service, mock_vector_store
+        self, service, mocks, monkeypatch, areturn
     ):
         """Test minimum similarity threshold filtering."""
-        with patch.object(
-            service, "get_issue_context", new_callable=AsyncMock
-        ) as mock_context:
-            mock_context.return_value = {
-                "issue_id": "AI-1799",
-                "title": "OAuth2 Authentication",
-                "description": "Implement OAuth2 flow",
-                "state": "In Progress",
-                "team": "AI",
-                "url": "https://linear.app/ai/AI-1799",
-            }
+        monkeypatch.setattr(service, "get_issue_context", areturn(_CTX_AI1799))
 
-            # Mock results with varying similarity
-            mock_vector_store.search_similar.return_value = [
-                {
-                    "issue_id": "AI-1820",
-                    "distance": 0.26,  # 87% similarity - above threshold
-                    "metadata": {
-                        "title": "OIDC Auth",
-                        "state": "Todo",
-                        "team_name": "AI",
-                        "url": "https://linear.app/ai/AI-1820",
-                    },
+        # Mock results with varying similarity
+        mocks.vector_store.search_similar.return_value = [
+            _HIT_AI1820,  # 87% similarity - above threshold
+            {
+                "issue_id": "AI-1805",
+                "distance": 1.2,  # 40% similarity - below 50% threshold
+                "metadata": {
+                    "title": "Different issue",
+                    "state": "Done",
+                    "team_name": "AI",
+                    "url": "https://linear.app/ai/AI-1805",
                 },
+            },
+        ]
+
+        # Execute with 50% min_similarity
+        results = await service.find_similar_issues(
+            "AI-1799", limit=5, min_similarity=0.5
+        )
+
+        # Verify - only high similarity result returned
+        assert len(results) == 1
+        assert results[0]["issue_id"] == "AI-1820"
+
+    @pytest.mark.asyncio
+    async def test_find_similar_issues_not_found(self, service, monkeypatch, areturn):
+        """Test finding similar issues when source issue not found."""
+        monkeypatch.setattr(service, "get_issue_context", areturn(None))
+
+        # Execute and verify exception
+        with pytest.raises(ValueError, match="Issue AI-9999 not found"):
+            await service.find_similar_issues("AI-9999")
+
+    @pytest.mark.asyncio
+    async def test_find_similar_issues_batch(self, service, mocks, monkeypatch):
+        """Test finding similar issues for several issues in one search."""
+        contexts = {
+            "AI-1799": _CTX_AI1799,
+            "DMD-480": {
+                "issue_id": "DMD-480",
+                "title": "Login bug",
+                "description": "",
+            },
+        }
+
+        async def mock_context(issue_id):
+            return contexts.get(issue_id)
+
+        monkeypatch.setattr(service, "get_issue_context", mock_context)
+        mocks.vector_store.search_similar_batch.return_value = [
+            [_HIT_AI1799_SELF, _HIT_AI1820],  # Self-match is filtered
+            [
                 {
-                    "issue_id": "AI-1805",
-                    "distance": 1.2,  # 40% similarity - below 50% threshold
-                    "metadata": {
-                        "title": "Different issue",
-                        "state": "Done",
-                        "team_name": "AI",
-                        "url": "https://linear.app/ai/AI-1805",
-                    },
+                    "issue_id": "DMD-500",
+                    "distance": 1.2,  # 40% similarity - below threshold
+                    "metadata": {"title": "Unrelated"},
                 },
-            ]
+            ],
+        ]
 
-            # Execute with 50% min_similarity
-            results = await service.find_similar_issues(
-                "AI-1799", limit=5, min_similarity=0.5
-            )
+        # AI-9999 does not exist and is skipped
+        results = await service.find_similar_issues_batch(
+            ["AI-1799", "AI-9999", "DMD-480"], limit=5, min_similarity=0.5
+        )
+
+        # One batched vector search for the issues that were found
+        mocks.vector_store.search_similar_batch.assert_called_once()
+        call_args = mocks.vector_store.search_similar_batch.call_args[1]
+        assert call_args["queries"] == [
+            "OAuth2 Authentication\n\nImplement OAuth2 flow",
+            "Login bug\n\n",
+        ]
+        assert call_args["limit"] == 6
 
-            # Verify - only high similarity result returned
-            assert len(results) == 1
-            assert results[0]["issue_id"] == "AI-1820"
+        assert set(results) == {"AI-1799", "DMD-480"}
+        assert [r["issue_id"] for r in results["AI-1799"]] == ["AI-1820"]
+        assert results["AI-1799"][0]["similarity"] == pytest.approx(0.87, abs=0.01)
+        assert results["DMD-480"] == []
 
     @pytest.mark.asyncio
-    async def test_find_similar_issues_not_found(self, service):
-        """Test finding similar issues when source issue not found."""
-        with patch.object(
-            service, "get_issue_context", new_callable=AsyncMock
-        ) as mock_context:
-            mock_context.return_value = None
+    async def test_find_similar_issues_batch_isolates_lookup_errors(
+        self, service, mocks, monkeypatch
+    ):
+        """Test that a failing source issue lookup only skips that issue."""
 
-            # Execute and verify exception
-            with pytest.raises(ValueError, match="Issue AI-9999 not found"):
-                await service.find_similar_issues("AI-9999")
+        async def mock_context(issue_id):
+            if issue_id == "DMD-480":
+                raise RuntimeError("Database error")
+            return _CTX_AI1799
+
+        monkeypatch.setattr(service, "get_issue_context", mock_context)
+        mocks.vector_store.search_similar_batch.return_value = [
+            [_HIT_AI1799_SELF, _HIT_AI1820],
+        ]
+
+        results = await service.find_similar_issues_batch(["AI-1799", "DMD-480"])
+
+        assert list(results) == ["AI-1799"]
+        assert [r["issue_id"] for r in results["AI-1799"]] == ["AI-1820"]
 
     @pytest.mark.asyncio
-    async def test_search_by_text_success(self, service, mock_vector_store):
+    async def test_search_by_text_success(self, service, mocks):
         """Test searching by natural language query."""
         # Mock vector store search
-        mock_vector_store.search_similar.return_value = [
+        mocks.vector_store.search_similar.return_value = [
             {
                 "issue_id": "AI-1820",
                 "distance": 0.4,  # 80% similarity
@@ -219,31 +303,29 @@ class TestSemanticSearchService:
         assert results[1]["similarity"] == pytest.approx(0.70, abs=0.01)
 
         # Verify vector store was called correctly
-        mock_vector_store.search_similar.assert_called_once_with(
+        mocks.vector_store.search_similar.assert_called_once_with(
             query="authentication issues", limit=10, filter_metadata=None
         )
 
     @pytest.mark.asyncio
-    async def test_search_by_text_with_filters(self, service, mock_vector_store):
+    async def test_search_by_text_with_filters(self, service, mocks):
         """Test searching with metadata filters."""
-        mock_vector_store.search_similar.return_value = []
+        mocks.vector_store.search_similar.return_value = []
 
         # Execute with filters
         filters = {"team_name": "AI", "state": "In Progress"}
         await service.search_by_text("performance", limit=5, filters=filters)
 
         # Verify filters were passed
-        mock_vector_store.search_similar.assert_called_once_with(
+        mocks.vector_store.search_similar.assert_called_once_with(
             query="performance", limit=10, filter_metadata=filters
         )
 
     @pytest.mark.asyncio
-    async def test_search_by_text_min_similarity_filter(
-        self, service, mock_vector_store
-    ):
+    async def test_search_by_text_min_similarity_filter(self, service, mocks):
         """Test minimum similarity filtering in text search."""
         # Mock results with varying similarity
-        mock_vector_store.search_similar.return_value = [
+        mocks.vector_store.search_similar.return_value = [
             {
                 "issue_id": "AI-1820",
                 "distance": 0.4,  # 80% similarity - above 30% threshold
@@ -276,125 +358,71 @@ class TestSemanticSearchService:
         assert results[0]["issue_id"] == "AI-1820"
 
     @pytest.mark.asyncio
-    async def test_get_issue_context_from_db(self):
+    async def test_get_issue_context_from_db(self, service, mocks):
         """Test getting issue context from database."""
-        # Need to create a fresh service with properly mocked dependencies
-        with (
-            patch("linear_chief.intelligence.semantic_search.IssueVectorStore"),
-            patch(
-                "linear_chief.intelligence.semantic_search.get_session_maker"
-            ) as mock_session_maker,
-            patch(
-                "linear_chief.intelligence.semantic_search.get_db_session"
-            ) as mock_db_session,
-            patch(
-                "linear_chief.intelligence.semantic_search.IssueHistoryRepository"
-            ) as mock_repo,
-        ):
-
-            # Mock database snapshot
-            mock_snapshot = MagicMock()
-            mock_snapshot.title = "OAuth2 Auth"
-            mock_snapshot.state = "In Progress"
-            mock_snapshot.team_name = "AI"
-            mock_snapshot.extra_metadata = {
-                "description": "Implement OAuth2",
-                "url": "https://linear.app/ai/AI-1799",
-            }
+        # Mock database snapshot
+        mock_snapshot = MagicMock()
+        mock_snapshot.title = "OAuth2 Auth"
+        mock_snapshot.state = "In Progress"
+        mock_snapshot.team_name = "AI"
+        mock_snapshot.extra_metadata = {
+            "description": "Implement OAuth2",
+            "url": "https://linear.app/ai/AI-1799",
+        }
+
+        # Mock repository
+        mock_repo_instance = mocks.IssueHistoryRepository.return_value
+        mock_repo_instance.get_issue_snapshot_by_identifier.return_value = mock_snapshot
+
+        # Mock session generator
+        mocks.get_db_session.return_value = [MagicMock()]
 
-            # Mock repository
-            mock_repo_instance = MagicMock()
-            mock_repo_instance.get_issue_snapshot_by_identifier.return_value = (
-                mock_snapshot
-            )
-            mock_repo.return_value = mock_repo_instance
-
-            # Mock session context manager
-            mock_session = MagicMock()
-            mock_db_session.return_value = [mock_session]
-
-            # Create service and execute
-            service = SemanticSearchService()
-            result = await service.get_issue_context("AI-1799")
-
-            # Verify
-            assert result is not None
-            assert result["issue_id"] == "AI-1799"
-            assert result["title"] == "OAuth2 Auth"
-            assert result["description"] == "Implement OAuth2"
-            assert result["state"] == "In Progress"
-            assert result["team"] == "AI"
-            assert result["url"] == "https://linear.app/ai/AI-1799"
+        result = await service.get_issue_context("AI-1799")
+
+        # Verify
+        assert result is not None
+        assert result["issue_id"] == "AI-1799"
+        assert result["title"] == "OAuth2 Auth"
+        assert result["description"] == "Implement OAuth2"
+        assert result["state"] == "In Progress"
+        assert result["team"] == "AI"
+        assert result["url"] == "https://linear.app/ai/AI-1799"
 
     @pytest.mark.asyncio
-    async def test_get_issue_context_from_linear_api(self, service):
+    async def test_get_issue_context_from_linear_api(self, service, mocks):
         """Test getting issue context from Linear API when not in DB."""
-        with (
-            patch(
-                "linear_chief.intelligence.semantic_search.get_session_maker"
-            ) as mock_session_maker,
-            patch(
-                "linear_chief.intelligence.semantic_search.get_db_session"
-            ) as mock_db_session,
-            patch(
-                "linear_chief.intelligence.semantic_search.IssueHistoryRepository"
-            ) as mock_repo,
-            patch(
-                "linear_chief.intelligence.semantic_search.LinearClient"
-            ) as mock_client,
-        ):
-
-            # Mock empty database
-            mock_repo_instance = MagicMock()
-            mock_repo_instance.get_issue_snapshot_by_identifier.return_value = None
-            mock_repo.return_value = mock_repo_instance
-
-            mock_session = MagicMock()
-            mock_db_session.return_value.__enter__.return_value = mock_session
-
-            # Mock Linear API response
-            mock_client_instance = MagicMock()
-            mock_client_instance.get_issue_by_identifier = AsyncMock(
-                return_value={
-                    "identifier": "AI-1799",
-                    "title": "OAuth2 Auth",
-                    "description": "Implement OAuth2",
-                    "state": {"name": "In Progress"},
-                    "team": {"name": "AI"},
-                    "url": "https://linear.app/ai/AI-1799",
-                }
-            )
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+        # Mock empty database
+        mock_repo_instance = mocks.IssueHistoryRepository.return_value
+        mock_repo_instance.get_issue_snapshot_by_identifier.return_value = None
+        mocks.get_db_session.return_value = [MagicMock()]
+
+        # Mock Linear API response
+        mock_client_instance = MagicMock()
+        mock_client_instance.get_issue_by_identifier = AsyncMock(
+            return_value={
+                "identifier": "AI-1799",
+                "title": "OAuth2 Auth",
+                "description": "Implement OAuth2",
+                "state": {"name": "In Progress"},
+                "team": {"name": "AI"},
+                "url": "https://linear.app/ai/AI-1799",
+            }
+        )
+        mocks.LinearClient.return_value.__aenter__.return_value = mock_client_instance
 
-            # Execute
-            result = await service.get_issue_context("AI-1799")
+        # Execute
+        result = await service.get_issue_context("AI-1799")
 
-            # Verify
-            assert result is not None
-            assert result["issue_id"] == "AI-1799"
-            assert result["title"] == "OAuth2 Auth"
-            assert result["description"] == "Implement OAuth2"
+        # Verify
+        assert result is not None
+        assert result["issue_id"] == "AI-1799"
+        assert result["title"] == "OAuth2 Auth"
+        assert result["description"] == "Implement OAuth2"
+        mock_repo_instance.get_issue_snapshot_by_identifier.assert_called_once()
 
     def test_format_similarity_results_with_score(self, service):
         """Test formatting results with similarity scores."""
-        results = [
-            {
-                "issue_id": "AI-1820",
-                "title": "OAuth2 implementation",
-                "similarity": 0.87,
-                "url": "https://linear.app/ai/AI-1820",
-                "state": "In Progress",
-                "team": "AI",
-            },
-            {
-                "issue_id": "AI-1799",
-                "title": "Auth refactor",
-                "similarity": 0.73,
-                "url": "https://linear.app/ai/AI-1799",
-                "state": "Done",
-                "team": "AI",
-            },
-        ]
+        results = [_RESULT_AI1820, _RESULT_AI1799]
 
         formatted = service.format_similarity_results(results, include_score=True)
 
@@ -408,16 +436,7 @@ class TestSemanticSearchService:
 
     def test_format_similarity_results_without_score(self, service):
         """Test formatting results without similarity scores."""
-        results = [
-            {
-                "issue_id": "AI-1820",
-                "title": "OAuth2 implementation",
-                "similarity": 0.87,
-                "url": "https://linear.app/ai/AI-1820",
-                "state": "In Progress",
-                "team": "AI",
-            }
-        ]
+        results = [_RESULT_AI1820]
 
         formatted = service.format_similarity_results(results, include_score=False)
 
@@ -433,16 +452,7 @@ class TestSemanticSearchService:
 
     def test_format_similarity_results_no_url(self, service):
         """Test formatting results without URLs."""
-        results = [
-            {
-                "issue_id": "AI-1820",
-                "title": "OAuth2 implementation",
-                "similarity": 0.87,
-                "url": "",  # No URL
-                "state": "In Progress",
-                "team": "AI",
-            }
-        ]
+        results = [{**_RESULT_AI1820, "url": ""}]  # No URL
 
         formatted = service.format_similarity_results(results)
 
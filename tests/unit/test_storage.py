@@ -2,53 +2,38 @@
 
 import pytest
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from linear_chief.storage import IssueHistory, Briefing, Metrics
+from linear_chief.storage import repositories
 
-from linear_chief.storage import (
-    Base,
-    IssueHistory,
-    Briefing,
-    Metrics,
-    IssueHistoryRepository,
-    BriefingRepository,
-    MetricsRepository,
-)
+# Fixed "current time" for tests that compare against repository cutoffs
+_NOW = datetime(2025, 1, 1)
 
 
-@pytest.fixture
-def engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    return engine
-
+class _FrozenDatetime(datetime):
+    """datetime whose utcnow() always returns _NOW."""
 
-@pytest.fixture
-def session(engine):
-    """Create database session for testing."""
-    SessionMaker = sessionmaker(bind=engine)
-    session = SessionMaker()
-    yield session
-    session.close()
+    @classmethod
+    def utcnow(cls):
+        return _NOW
 
 
 @pytest.fixture
-def issue_repo(session):
-    """Create IssueHistoryRepository instance."""
-    return IssueHistoryRepository(session)
+def frozen_clock(monkeypatch):
+    """
+    Freeze the clock used by repositories for time-window cutoffs.
 
+    Only the repository clock is frozen: rows inserted without explicit
+    timestamps still get the database's CURRENT_TIMESTAMP, so tests set
+    timestamps relative to _NOW on every row they compare.
+    """
+    monkeypatch.setattr(repositories, "datetime", _FrozenDatetime)
+    return _NOW
 
-@pytest.fixture
-def briefing_repo(session):
-    """Create BriefingRepository instance."""
-    return BriefingRepository(session)
 
-
-@pytest.fixture
-def metrics_repo(session):
-    """Create MetricsRepository instance."""
-    return MetricsRepository(session)
+def _bulk_save(session, objects):
+    """Insert several ORM objects with a single commit."""
+    session.add_all(objects)
+    session.commit()
 
 
 class TestIssueHistory:
@@ -138,21 +123,23 @@ class TestIssueHistoryRepository:
         )
 
         # Manually set old timestamp
-        old_snapshot.snapshot_at = datetime.utcnow() - timedelta(days=10)
+        old_snapshot.snapshot_at = _NOW - timedelta(days=10)
         issue_repo.session.commit()
 
         # Create recent snapshot
-        issue_repo.save_snapshot(
+        recent_snapshot = issue_repo.save_snapshot(
             issue_id="PROJ-123",
             linear_id="uuid-123",
             title="Test",
             state="In Progress",
         )
+        recent_snapshot.snapshot_at = _NOW - timedelta(days=1)
+        issue_repo.session.commit()
 
         # Query snapshots from last 7 days
         recent = issue_repo.get_snapshots_since(
             "PROJ-123",
-            datetime.utcnow() - timedelta(days=7),
+            _NOW - timedelta(days=7),
         )
 
         assert len(recent) == 1
@@ -161,18 +148,22 @@ class TestIssueHistoryRepository:
     def test_get_all_latest_snapshots(self, issue_repo):
         """Test retrieving latest snapshot for each issue."""
         # Create snapshots for multiple issues
-        issue_repo.save_snapshot(
-            issue_id="PROJ-123",
-            linear_id="uuid-123",
-            title="Test 1",
-            state="Done",
-        )
-
-        issue_repo.save_snapshot(
-            issue_id="PROJ-456",
-            linear_id="uuid-456",
-            title="Test 2",
-            state="In Progress",
+        _bulk_save(
+            issue_repo.session,
+            [
+                IssueHistory(
+                    issue_id="PROJ-123",
+                    linear_id="uuid-123",
+                    title="Test 1",
+                    state="Done",
+                ),
+                IssueHistory(
+                    issue_id="PROJ-456",
+                    linear_id="uuid-456",
+                    title="Test 2",
+                    state="In Progress",
+                ),
+            ],
         )
 
         latest_snapshots = issue_repo.get_all_latest_snapshots(days=30)
@@ -201,7 +192,7 @@ class TestIssueHistoryRepository:
         assert snapshot.title == "Fresh Issue"
         assert snapshot.state == "In Progress"
 
-    def test_get_issue_snapshot_by_identifier_stale(self, issue_repo):
+    def test_get_issue_snapshot_by_identifier_stale(self, issue_repo, frozen_clock):
         """Test that stale snapshots are not returned."""
         # Create snapshot
         snapshot = issue_repo.save_snapshot(
@@ -212,7 +203,7 @@ class TestIssueHistoryRepository:
         )
 
         # Manually set old timestamp (2 hours ago)
-        snapshot.snapshot_at = datetime.utcnow() - timedelta(hours=2)
+        snapshot.snapshot_at = _NOW - timedelta(hours=2)
         issue_repo.session.commit()
 
         # Should return None for stale snapshot (max_age_hours=1)
@@ -228,7 +219,9 @@ class TestIssueHistoryRepository:
         )
         assert result is None
 
-    def test_get_issue_snapshot_by_identifier_custom_max_age(self, issue_repo):
+    def test_get_issue_snapshot_by_identifier_custom_max_age(
+        self, issue_repo, frozen_clock
+    ):
         """Test custom max_age_hours parameter."""
         # Create snapshot
         snapshot = issue_repo.save_snapshot(
@@ -239,7 +232,7 @@ class TestIssueHistoryRepository:
         )
 
         # Manually set timestamp (2 hours ago)
-        snapshot.snapshot_at = datetime.utcnow() - timedelta(hours=2)
+        snapshot.snapshot_at = _NOW - timedelta(hours=2)
         issue_repo.session.commit()
 
         # Should return None with max_age_hours=1
@@ -303,8 +296,6 @@ class TestBriefingRepository:
 
         briefing_repo.mark_as_sent(briefing.id, telegram_message_id="12345")
 
-        # Refresh from DB
-        briefing_repo.session.refresh(briefing)
         assert briefing.delivery_status == "sent"
         assert briefing.telegram_message_id == "12345"
         assert briefing.sent_at is not None
@@ -318,26 +309,26 @@ class TestBriefingRepository:
 
         briefing_repo.mark_as_failed(briefing.id, "Connection timeout")
 
-        # Refresh from DB
-        briefing_repo.session.refresh(briefing)
         assert briefing.delivery_status == "failed"
         assert briefing.error_message == "Connection timeout"
 
-    def test_get_recent_briefings(self, briefing_repo):
+    def test_get_recent_briefings(self, briefing_repo, frozen_clock):
         """Test retrieving recent briefings."""
         # Create old briefing
         old_briefing = briefing_repo.create_briefing(
             content="Old",
             issue_count=1,
         )
-        old_briefing.generated_at = datetime.utcnow() - timedelta(days=10)
+        old_briefing.generated_at = _NOW - timedelta(days=10)
         briefing_repo.session.commit()
 
         # Create recent briefing
-        briefing_repo.create_briefing(
+        recent_briefing = briefing_repo.create_briefing(
             content="Recent",
             issue_count=1,
         )
+        recent_briefing.generated_at = _NOW - timedelta(days=1)
+        briefing_repo.session.commit()
 
         recent = briefing_repo.get_recent_briefings(days=7)
         assert len(recent) == 1
@@ -421,13 +412,18 @@ class TestMetricsRepository:
     def test_get_aggregated_metrics(self, metrics_repo):
         """Test aggregated metrics calculation."""
         # Create multiple metrics
-        for value in [1, 2, 3, 4, 5]:
-            metrics_repo.record_metric(
-                metric_type="test",
-                metric_name="test_metric",
-                value=value,
-                unit="count",
-            )
+        _bulk_save(
+            metrics_repo.session,
+            [
+                Metrics(
+                    metric_type="test",
+                    metric_name="test_metric",
+                    value=value,
+                    unit="count",
+                )
+                for value in range(1, 6)
+            ],
+        )
 
         agg = metrics_repo.get_aggregated_metrics(
             metric_type="test",
@@ -1,107 +1,184 @@
 """Unit tests for Telegram callback query handlers."""
 
+import asyncio
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 from telegram import Update, CallbackQuery, Message, Chat, User
 
+from linear_chief.telegram import callbacks as _cb
 from linear_chief.telegram.callbacks import (
     feedback_callback_handler,
     issue_action_callback_handler,
 )
 
+# Handlers never inspect the callback context
+_CTX = object()
 
-@pytest.fixture
+
+def _public_attrs(cls):
+    """List public attribute names of cls for use as a Mock spec."""
+    return [name for name in dir(cls) if not name.startswith("_")]
+
+
+# Precomputed specs so each Mock skips class introspection
+_USER_ATTRS = _public_attrs(User)
+_CHAT_ATTRS = _public_attrs(Chat)
+_MESSAGE_ATTRS = _public_attrs(Message)
+_CALLBACK_QUERY_ATTRS = _public_attrs(CallbackQuery)
+_UPDATE_ATTRS = _public_attrs(Update)
+
+
+class _Recorder:
+    """
+    Minimal stand-in for AsyncMock that only records calls.
+
+    Every call returns the same already-resolved future, so awaiting it
+    costs no coroutine. Calls are stored as ``(args, kwargs)`` tuples, and
+    only the subset of the Mock assertion API used in this module is
+    supported.
+    """
+
+    def __init__(self, done):
+        self.call_args_list = []
+        self._done = done
+
+    def __call__(self, *args, **kwargs):
+        self.call_args_list.append((args, kwargs))
+        return self._done
+
+    @property
+    def call_args(self):
+        return self.call_args_list[-1] if self.call_args_list else None
+
+    @property
+    def call_count(self):
+        return len(self.call_args_list)
+
+    def assert_called(self):
+        assert self.call_args_list, "Expected call not made"
+
+    def assert_called_once(self):
+        assert (
+            self.call_count == 1
+        ), f"Expected to be called once. Called {self.call_count} times."
+
+
+@pytest.fixture(scope="session")
+async def done_future():
+    """Create one resolved Future on the running (session-scoped) event loop."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(None)
+    return future
+
+
+@pytest.fixture(scope="session")
 def mock_user():
-    """Create mock Telegram user."""
-    user = Mock(spec=User)
+    """Create mock Telegram user (read-only, shared across tests)."""
+    user = Mock(spec_set=_USER_ATTRS)
     user.id = 12345
     user.first_name = "Test"
     user.username = "testuser"
     return user
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_chat():
-    """Create mock Telegram chat."""
-    chat = Mock(spec=Chat)
+    """Create mock Telegram chat (read-only, shared across tests)."""
+    chat = Mock(spec_set=_CHAT_ATTRS)
     chat.id = 67890
     chat.type = "private"
     return chat
 
 
 @pytest.fixture
-def mock_message(mock_chat):
+def mock_message(mock_chat, done_future):
     """Create mock Telegram message."""
-    message = Mock(spec=Message)
+    message = Mock(spec_set=_MESSAGE_ATTRS)
     message.message_id = 123
     message.chat = mock_chat
-    message.reply_text = AsyncMock()
+    message.reply_text = _Recorder(done_future)
     return message
 
 
 @pytest.fixture
-def mock_callback_query(mock_user, mock_message):
+def mock_callback_query(mock_user, mock_message, done_future):
     """Create mock CallbackQuery."""
-    query = Mock(spec=CallbackQuery)
+    query = Mock(spec_set=_CALLBACK_QUERY_ATTRS)
     query.id = "callback_123"
     query.from_user = mock_user
     query.message = mock_message
     query.data = None
-    query.answer = AsyncMock()
-    query.edit_message_reply_markup = AsyncMock()
+    query.answer = _Recorder(done_future)
+    query.edit_message_reply_markup = _Recorder(done_future)
     return query
 
 
 @pytest.fixture
 def mock_update(mock_callback_query):
     """Create mock Update with CallbackQuery."""
-    update = Mock(spec=Update)
+    update = Mock(spec_set=_UPDATE_ATTRS)
     update.callback_query = mock_callback_query
     return update
 
 
 @pytest.fixture
+def noquery_update():
+    """Create Update stub without a CallbackQuery."""
+    return SimpleNamespace(callback_query=None)
+
+
+@pytest.fixture(scope="session")
 def mock_context():
-    """Create mock Telegram context."""
-    return Mock()
+    """Return placeholder Telegram context."""
+    return _CTX
+
+
+@pytest.fixture
+def patched_db(monkeypatch):
+    """Patch database access in callbacks and return the mock FeedbackRepository."""
+    repo = Mock(save_feedback=Mock())
+    monkeypatch.setattr(_cb, "get_session_maker", Mock())
+    monkeypatch.setattr(_cb, "get_db_session", lambda *_: [Mock()])
+    monkeypatch.setattr(_cb, "FeedbackRepository", lambda *_a, **_k: repo)
+    return repo
 
 
 class TestFeedbackCallbackHandler:
     """Tests for feedback callback handler (thumbs up/down)."""
 
-    @pytest.mark.asyncio
-    async def test_feedback_positive(
-        self, mock_update, mock_context, mock_callback_query, mock_message
+    @pytest.mark.parametrize(
+        "data,expected_type,expected_substr",
+        [
+            ("feedback_positive", "positive", "helpful"),
+            ("feedback_negative", "negative", "improving"),
+        ],
+        ids=["positive", "negative"],
+    )
+    async def test_feedback(
+        self,
+        data,
+        expected_type,
+        expected_substr,
+        mock_update,
+        mock_context,
+        mock_callback_query,
+        mock_message,
+        patched_db,
     ):
-        """Test positive feedback callback."""
-        mock_callback_query.data = "feedback_positive"
-
-        with patch(
-            "linear_chief.telegram.callbacks.get_session_maker"
-        ) as mock_get_session_maker, patch(
-            "linear_chief.telegram.callbacks.get_db_session"
-        ) as mock_get_db_session:
-
-            mock_session = Mock()
-            mock_get_db_session.return_value = [mock_session]
+        """Test positive and negative feedback callbacks."""
+        mock_callback_query.data = data
 
-            mock_feedback_repo = Mock()
-            mock_feedback_repo.save_feedback = Mock()
-
-            with patch(
-                "linear_chief.telegram.callbacks.FeedbackRepository",
-                return_value=mock_feedback_repo,
-            ):
-                await feedback_callback_handler(mock_update, mock_context)
+        await feedback_callback_handler(mock_update, mock_context)
 
         # Verify answer was called
         mock_callback_query.answer.assert_called_once()
 
-        # Verify feedback was saved
-        mock_feedback_repo.save_feedback.assert_called_once()
-        call_args = mock_feedback_repo.save_feedback.call_args
+        # Verify feedback was saved with correct type
+        patched_db.save_feedback.assert_called_once()
+        call_args = patched_db.save_feedback.call_args
         assert call_args[1]["user_id"] == "12345"
-        assert call_args[1]["feedback_type"] == "positive"
+        assert call_args[1]["feedback_type"] == expected_type
 
         # Verify buttons were removed
         mock_callback_query.edit_message_reply_markup.assert_called_once()
@@ -110,55 +187,13 @@ class TestFeedbackCallbackHandler:
         mock_message.reply_text.assert_called_once()
         ack_text = mock_message.reply_text.call_args[0][0]
         assert "Thanks for your feedback" in ack_text
-        assert "helpful" in ack_text
-
-    @pytest.mark.asyncio
-    async def test_feedback_negative(
-        self, mock_update, mock_context, mock_callback_query, mock_message
-    ):
-        """Test negative feedback callback."""
-        mock_callback_query.data = "feedback_negative"
-
-        with patch(
-            "linear_chief.telegram.callbacks.get_session_maker"
-        ) as mock_get_session_maker, patch(
-            "linear_chief.telegram.callbacks.get_db_session"
-        ) as mock_get_db_session:
-
-            mock_session = Mock()
-            mock_get_db_session.return_value = [mock_session]
-
-            mock_feedback_repo = Mock()
-            mock_feedback_repo.save_feedback = Mock()
-
-            with patch(
-                "linear_chief.telegram.callbacks.FeedbackRepository",
-                return_value=mock_feedback_repo,
-            ):
-                await feedback_callback_handler(mock_update, mock_context)
+        assert expected_substr in ack_text
 
-        # Verify answer was called
-        mock_callback_query.answer.assert_called_once()
-
-        # Verify feedback was saved with correct type
-        mock_feedback_repo.save_feedback.assert_called_once()
-        call_args = mock_feedback_repo.save_feedback.call_args
-        assert call_args[1]["feedback_type"] == "negative"
-
-        # Verify acknowledgment message
-        mock_message.reply_text.assert_called_once()
-        ack_text = mock_message.reply_text.call_args[0][0]
-        assert "improving" in ack_text
-
-    @pytest.mark.asyncio
-    async def test_feedback_callback_no_query(self, mock_update, mock_context):
+    async def test_feedback_callback_no_query(self, noquery_update, mock_context):
         """Test feedback callback when query is None."""
-        mock_update.callback_query = None
-
         # Should not raise error
-        await feedback_callback_handler(mock_update, mock_context)
+        await feedback_callback_handler(noquery_update, mock_context)
 
-    @pytest.mark.asyncio
     async def test_feedback_callback_no_data(
         self, mock_update, mock_context, mock_callback_query
     ):
@@ -170,7 +205,6 @@ class TestFeedbackCallbackHandler:
         # Should answer and not proceed
         mock_callback_query.answer.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_feedback_callback_unknown_data(
         self, mock_update, mock_context, mock_callback_query
     ):
@@ -184,144 +218,69 @@ class TestFeedbackCallbackHandler:
         call_args = mock_callback_query.edit_message_reply_markup.call_args
         assert call_args[1]["reply_markup"] is None
 
-    @pytest.mark.asyncio
     async def test_feedback_callback_saves_message_id(
-        self, mock_update, mock_context, mock_callback_query, mock_message
+        self, mock_update, mock_context, mock_callback_query, mock_message, patched_db
     ):
         """Test feedback callback saves telegram_message_id in metadata."""
         mock_callback_query.data = "feedback_positive"
         mock_message.message_id = 456
 
-        with patch(
-            "linear_chief.telegram.callbacks.get_session_maker"
-        ) as mock_get_session_maker, patch(
-            "linear_chief.telegram.callbacks.get_db_session"
-        ) as mock_get_db_session:
-
-            mock_session = Mock()
-            mock_get_db_session.return_value = [mock_session]
-
-            mock_feedback_repo = Mock()
-            mock_feedback_repo.save_feedback = Mock()
-
-            with patch(
-                "linear_chief.telegram.callbacks.FeedbackRepository",
-                return_value=mock_feedback_repo,
-            ):
-                await feedback_callback_handler(mock_update, mock_context)
+        await feedback_callback_handler(mock_update, mock_context)
 
         # Verify metadata includes message_id
-        call_args = mock_feedback_repo.save_feedback.call_args
+        call_args = patched_db.save_feedback.call_args
         assert call_args[1]["extra_metadata"]["telegram_message_id"] == "456"
 
-    @pytest.mark.asyncio
-    async def test_feedback_callback_error_handling(
-        self, mock_update, mock_context, mock_callback_query
-    ):
-        """Test feedback callback error handling."""
-        mock_callback_query.data = "feedback_positive"
-
-        with patch(
-            "linear_chief.telegram.callbacks.get_session_maker"
-        ) as mock_get_session_maker:
-            mock_get_session_maker.side_effect = Exception("Database error")
-
-            await feedback_callback_handler(mock_update, mock_context)
-
-            # Should answer with error message
-            mock_callback_query.answer.assert_called()
-
 
 class TestIssueActionCallbackHandler:
     """Tests for issue action callback handler (mark done, unsubscribe)."""
 
-    @pytest.mark.asyncio
-    async def test_issue_action_done(
-        self, mock_update, mock_context, mock_callback_query, mock_message
+    @pytest.mark.parametrize(
+        "data,expected_action,expected_substr",
+        [
+            ("issue_done_PROJ-123", "done", "marked as done"),
+            ("issue_unsub_PROJ-456", "unsubscribe", "unsubscribed"),
+        ],
+        ids=["done", "unsubscribe"],
+    )
+    async def test_issue_action(
+        self,
+        data,
+        expected_action,
+        expected_substr,
+        mock_update,
+        mock_context,
+        mock_callback_query,
+        mock_message,
+        patched_db,
     ):
-        """Test mark issue as done callback."""
-        mock_callback_query.data = "issue_done_PROJ-123"
+        """Test mark-as-done and unsubscribe callbacks."""
+        mock_callback_query.data = data
+        issue_id = data.split("_", 2)[2]
 
-        with patch(
-            "linear_chief.telegram.callbacks.get_session_maker"
-        ) as mock_get_session_maker, patch(
-            "linear_chief.telegram.callbacks.get_db_session"
-        ) as mock_get_db_session:
-
-            mock_session = Mock()
-            mock_get_db_session.return_value = [mock_session]
-
-            mock_feedback_repo = Mock()
-            mock_feedback_repo.save_feedback = Mock()
-
-            with patch(
-                "linear_chief.telegram.callbacks.FeedbackRepository",
-                return_value=mock_feedback_repo,
-            ):
-                await issue_action_callback_handler(mock_update, mock_context)
+        await issue_action_callback_handler(mock_update, mock_context)
 
         # Verify answer was called
         mock_callback_query.answer.assert_called_once()
 
         # Verify feedback was saved with action metadata
-        mock_feedback_repo.save_feedback.assert_called_once()
-        call_args = mock_feedback_repo.save_feedback.call_args
+        patched_db.save_feedback.assert_called_once()
+        call_args = patched_db.save_feedback.call_args
         assert call_args[1]["feedback_type"] == "issue_action"
-        assert call_args[1]["extra_metadata"]["action"] == "done"
-        assert call_args[1]["extra_metadata"]["issue_id"] == "PROJ-123"
+        assert call_args[1]["extra_metadata"]["action"] == expected_action
+        assert call_args[1]["extra_metadata"]["issue_id"] == issue_id
 
         # Verify acknowledgment message
         mock_message.reply_text.assert_called_once()
         ack_text = mock_message.reply_text.call_args[0][0]
-        assert "PROJ-123" in ack_text
-        assert "marked as done" in ack_text
-
-    @pytest.mark.asyncio
-    async def test_issue_action_unsubscribe(
-        self, mock_update, mock_context, mock_callback_query, mock_message
-    ):
-        """Test unsubscribe from issue callback."""
-        mock_callback_query.data = "issue_unsub_PROJ-456"
-
-        with patch(
-            "linear_chief.telegram.callbacks.get_session_maker"
-        ) as mock_get_session_maker, patch(
-            "linear_chief.telegram.callbacks.get_db_session"
-        ) as mock_get_db_session:
-
-            mock_session = Mock()
-            mock_get_db_session.return_value = [mock_session]
-
-            mock_feedback_repo = Mock()
-            mock_feedback_repo.save_feedback = Mock()
-
-            with patch(
-                "linear_chief.telegram.callbacks.FeedbackRepository",
-                return_value=mock_feedback_repo,
-            ):
-                await issue_action_callback_handler(mock_update, mock_context)
-
-        # Verify feedback was saved with correct action
-        mock_feedback_repo.save_feedback.assert_called_once()
-        call_args = mock_feedback_repo.save_feedback.call_args
-        assert call_args[1]["extra_metadata"]["action"] == "unsubscribe"
-        assert call_args[1]["extra_metadata"]["issue_id"] == "PROJ-456"
+        assert issue_id in ack_text
+        assert expected_substr in ack_text
 
-        # Verify acknowledgment message
-        mock_message.reply_text.assert_called_once()
-        ack_text = mock_message.reply_text.call_args[0][0]
-        assert "PROJ-456" in ack_text
-        assert "unsubscribed" in ack_text
-
-    @pytest.mark.asyncio
-    async def test_issue_action_callback_no_query(self, mock_update, mock_context):
+    async def test_issue_action_callback_no_query(self, noquery_update, mock_context):
         """Test issue action callback when query is None."""
-        mock_update.callback_query = None
-
         # Should not raise error
-        await issue_action_callback_handler(mock_update, mock_context)
+        await issue_action_callback_handler(noquery_update, mock_context)
 
-    @pytest.mark.asyncio
     async def test_issue_action_callback_no_data(
         self, mock_update, mock_context, mock_callback_query
     ):
@@ -333,7 +292,6 @@ class TestIssueActionCallbackHandler:
         # Should answer and not proceed
         mock_callback_query.answer.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_issue_action_callback_unknown_action(
         self, mock_update, mock_context, mock_callback_query
     ):
@@ -347,75 +305,69 @@ class TestIssueActionCallbackHandler:
         call_args = mock_callback_query.edit_message_reply_markup.call_args
         assert call_args[1]["reply_markup"] is None
 
-    @pytest.mark.asyncio
     async def test_issue_action_callback_removes_buttons(
-        self, mock_update, mock_context, mock_callback_query
+        self, mock_update, mock_context, mock_callback_query, patched_db
     ):
         """Test issue action callback removes buttons after action."""
         mock_callback_query.data = "issue_done_PROJ-123"
 
-        with patch(
-            "linear_chief.telegram.callbacks.get_session_maker"
-        ) as mock_get_session_maker, patch(
-            "linear_chief.telegram.callbacks.get_db_session"
-        ) as mock_get_db_session:
-
-            mock_session = Mock()
-            mock_get_db_session.return_value = [mock_session]
-
-            mock_feedback_repo = Mock()
-            with patch(
-                "linear_chief.telegram.callbacks.FeedbackRepository",
-                return_value=mock_feedback_repo,
-            ):
-                await issue_action_callback_handler(mock_update, mock_context)
+        await issue_action_callback_handler(mock_update, mock_context)
 
         # Verify buttons removed
         mock_callback_query.edit_message_reply_markup.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_issue_action_callback_error_handling(
-        self, mock_update, mock_context, mock_callback_query
-    ):
-        """Test issue action callback error handling."""
-        mock_callback_query.data = "issue_done_PROJ-123"
-
-        with patch(
-            "linear_chief.telegram.callbacks.get_session_maker"
-        ) as mock_get_session_maker:
-            mock_get_session_maker.side_effect = Exception("Database error")
-
-            await issue_action_callback_handler(mock_update, mock_context)
-
-            # Should answer with error message
-            mock_callback_query.answer.assert_called()
-
-    @pytest.mark.asyncio
     async def test_issue_action_multiple_issues(
-        self, mock_update, mock_context, mock_callback_query, mock_message
+        self, mock_context, mock_user, mock_message, patched_db, done_future
     ):
-        """Test issue action with different issue IDs."""
+        """Test concurrent issue actions with different issue IDs."""
         issue_ids = ["PROJ-123", "ENG-456", "DESIGN-789"]
 
-        with patch(
-            "linear_chief.telegram.callbacks.get_session_maker"
-        ) as mock_get_session_maker, patch(
-            "linear_chief.telegram.callbacks.get_db_session"
-        ) as mock_get_db_session:
-
-            mock_session = Mock()
-            mock_get_db_session.return_value = [mock_session]
-
-            mock_feedback_repo = Mock()
-            mock_feedback_repo.save_feedback = Mock()
-
-            with patch(
-                "linear_chief.telegram.callbacks.FeedbackRepository",
-                return_value=mock_feedback_repo,
-            ):
-                for issue_id in issue_ids:
-                    mock_callback_query.data = f"issue_done_{issue_id}"
-                    await issue_action_callback_handler(mock_update, mock_context)
-
-        # Verify all issues were processed
-        assert mock_feedback_repo.save_feedback.call_count == 3
+        def make_update(issue_id):
+            query = Mock(spec_set=_CALLBACK_QUERY_ATTRS)
+            query.from_user = mock_user
+            query.message = mock_message
+            query.data = f"issue_done_{issue_id}"
+            query.answer = _Recorder(done_future)
+            query.edit_message_reply_markup = _Recorder(done_future)
+            update = Mock(spec_set=_UPDATE_ATTRS)
+            update.callback_query = query
+            return update
+
+        await asyncio.gather(
+            *[
+                issue_action_callback_handler(make_update(i), mock_context)
+                for i in issue_ids
+            ]
+        )
+
+        # Verify all issues were processed (completion order is not guaranteed)
+        assert patched_db.save_feedback.call_count == 3
+        saved_ids = {
+            c.kwargs["extra_metadata"]["issue_id"]
+            for c in patched_db.save_feedback.call_args_list
+        }
+        assert saved_ids == set(issue_ids)
+
+
+@pytest.mark.parametrize(
+    "handler,data",
+    [
+        (feedback_callback_handler, "feedback_positive"),
+        (issue_action_callback_handler, "issue_done_PROJ-123"),
+    ],
+    ids=["feedback", "issue_action"],
+)
+async def test_callback_error_handling(
+    handler, data, mock_update, mock_context, mock_callback_query, monkeypatch
+):
+    """Test callbacks answer with an error message when the database fails."""
+    mock_callback_query.data = data
+    monkeypatch.setattr(
+        _cb, "get_session_maker", Mock(side_effect=Exception("Database error"))
+    )
+
+    await handler(mock_update, mock_context)
+
+    # Should answer with error message
+    mock_callback_query.answer.assert_called()
+    assert "something went wrong" in mock_callback_query.answer.call_args[0][0]
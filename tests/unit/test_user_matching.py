@@ -4,7 +4,22 @@ Tests the _normalize_name and _is_user_assignee functions to ensure
 robust matching across different name formats, diacritics, and case variations.
 """
 
-from linear_chief.agent.context_builder import _normalize_name, _is_user_assignee
+import unicodedata
+
+import pytest
+
+from linear_chief.agent.context_builder import (
+    PreparedUser,
+    _normalize_name,
+    _is_user_assignee,
+    _is_prepared_user_assignee,
+)
+
+# Czech diacritic characters and their expected normalized form
+_CZECH_MAP = {
+    **dict(zip("áčďéěíňóřšťúůýž", "acdeeinorstuuyz")),
+    **dict(zip("ÁČĎÉĚÍŇÓŘŠŤÚŮÝŽ", "acdeeinorstuuyz")),
+}
 
 
 class TestNameNormalization:
@@ -24,15 +39,12 @@ class TestNameNormalization:
         assert _normalize_name("Lukáš Řehořek") == "lukas rehorek"
         assert _normalize_name("Ondřej Popelka") == "ondrej popelka"
 
-    def test_all_czech_diacritics(self):
-        """Test all Czech diacritic characters."""
-        # Lowercase diacritics
-        assert _normalize_name("á é í ó ú ý") == "a e i o u y"
-        assert _normalize_name("č ď ě ň ř š ť ů ž") == "c d e n r s t u z"
-
-        # Uppercase diacritics
-        assert _normalize_name("Á É Í Ó Ú Ý") == "a e i o u y"
-        assert _normalize_name("Č Ď Ě Ň Ř Š Ť Ů Ž") == "c d e n r s t u z"
+    @pytest.mark.parametrize("char,expected", list(_CZECH_MAP.items()))
+    def test_all_czech_diacritics(self, char, expected):
+        """Test every Czech diacritic character, lowercase and uppercase."""
+        assert _normalize_name(char) == expected
+        # Decomposed input goes through the NFD path and must agree
+        assert _normalize_name(unicodedata.normalize("NFD", char)) == expected
 
     def test_case_insensitive(self):
         """Test case normalization."""
@@ -199,6 +211,30 @@ class TestUserAssigneeMatching:
         )
 
 
+class TestPreparedUser:
+    """Test matching against a pre-normalized configured user."""
+
+    def test_from_config_normalizes_fields(self):
+        """Test that name and email are normalized once on creation."""
+        user = PreparedUser.from_config(" Petr Šimeček ", "Petr@Keboola.com ")
+        assert user.name_norm == "petr simecek"
+        assert user.email_norm == "petr@keboola.com"
+
+    def test_from_config_empty_fields(self):
+        """Test that missing configuration yields empty keys."""
+        user = PreparedUser.from_config("", "")
+        assert user.name_norm == ""
+        assert user.email_norm == ""
+
+    def test_prepared_match_via_email_and_name(self):
+        """Test prepared matching uses the same strategies as _is_user_assignee."""
+        user = PreparedUser.from_config("Petr Simecek", "petr@keboola.com")
+        assert _is_prepared_user_assignee("Tomáš Fejfar", "PETR@keboola.com", user)
+        assert _is_prepared_user_assignee("Petr Šimeček", None, user)
+        assert _is_prepared_user_assignee("petr simecek", None, user)
+        assert not _is_prepared_user_assignee("Tomáš Fejfar", None, user)
+
+
 class TestEdgeCases:
     """Test edge cases and unusual inputs."""
 
@@ -208,8 +244,6 @@ class TestEdgeCases:
         nfc_name = "José"
 
         # NFD: decomposed (e + combining accent)
-        import unicodedata
-
         nfd_name = unicodedata.normalize("NFD", "José")
 
         # Both should normalize to the same result